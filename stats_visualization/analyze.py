@@ -11,9 +11,15 @@ import os
 import sys
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any, Iterable, Optional
-from collections import Counter
+from typing import Dict, List, Any, Iterable, Optional, Tuple, Union
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import product
 import logging
+from operator import itemgetter
+import numpy as np
+from dotenv import load_dotenv
 from stats_visualization.utils import setup_file_logging
 
 # Ensure project root on path early before local imports
@@ -21,7 +27,17 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from stats_visualization.utils import filter_matches  # noqa: E402
+from stats_visualization.utils import (  # noqa: E402
+    MATCH_FILE_SUFFIXES,
+    atomic_write_bytes,
+    filter_matches,
+    json_dumps,
+    json_loads,
+    find_participant,
+    load_match_json,
+    load_player_config,
+    match_file_excluded,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,24 +62,114 @@ def apply_analysis_filters(
     )
 
 
-def _count_player_matches(matches: List[Dict[str, Any]], player_puuid: str) -> int:
+def _count_player_matches(matches: Iterable[Dict[str, Any]], player_puuid: str) -> int:
     """Return number of matches in which the player participated."""
-    count = 0
-    for m in matches:
-        info = m.get("info", {})
-        for p in info.get("participants", []):
-            if p.get("puuid") == player_puuid:
-                count += 1
-                break
-    return count
+    return sum(find_participant(m, player_puuid) is not None for m in matches)
 
 
-def load_match_files(matches_dir: str = "matches") -> List[Dict[str, Any]]:
+def _scan_match_files(matches_dir: Union[str, Path]) -> List["os.DirEntry[str]"]:
+    """Return DirEntry objects for ``*.json`` / ``*.json.gz`` files in ``matches_dir``.
+
+    ``os.scandir`` reuses the directory listing's file type (and, on Windows,
+    stat) information, avoiding the extra per-file syscalls of ``Path.glob``.
+    A missing directory yields an empty list.
+    """
+    try:
+        with os.scandir(matches_dir) as it:
+            return [e for e in it if e.name.endswith(MATCH_FILE_SUFFIXES) and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+# Parsed-match cache stored alongside the match JSONs.
+# Maps file name -> (st_mtime_ns, st_size, parsed match dict). Stored as plain
+# JSON (not pickle) so a shared or downloaded matches directory cannot run
+# code when loaded; the suffix keeps it out of the ``*.json`` match scan.
+MATCH_CACHE_FILENAME = ".match_cache.json.cache"
+MatchCache = Dict[str, Tuple[int, int, Dict[str, Any]]]
+
+# In-process copy of the parse cache per matches directory (absolute path), so
+# repeated load_match_files calls in one run (e.g. generate_all_visuals) skip
+# re-reading the cache file. Entries are still validated against each file's
+# mtime/size.
+_MATCH_MEMORY_CACHE: Dict[str, MatchCache] = {}
+
+
+def _read_match_cache(cache_path: Path) -> MatchCache:
+    """Return the parse cache, or an empty dict if missing/unreadable.
+
+    Malformed entries are dropped; their files are simply parsed again.
+    """
+    try:
+        raw = json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    cache: MatchCache = {}
+    for name, entry in raw.items():
+        if (
+            isinstance(entry, list)
+            and len(entry) == 3
+            and isinstance(entry[0], int)
+            and isinstance(entry[1], int)
+            and isinstance(entry[2], dict)
+        ):
+            cache[name] = (entry[0], entry[1], entry[2])
+    return cache
+
+
+def _write_match_cache(cache_path: Path, cache: MatchCache) -> None:
+    """Persist the parse cache; failures are logged and otherwise ignored."""
+    try:
+        atomic_write_bytes(cache_path, json_dumps(cache))
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to write match cache {cache_path}: {e}")
+
+
+# Parsing mostly waits on disk reads, so allow more threads than cores
+_PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _parse_match_file(path: str, filters: Optional[Dict[str, Any]] = None) -> Any:
+    """Parse one match file; returns None unparsed if its header fails ``filters``."""
+    if filters is not None and match_file_excluded(path, **filters):
+        return None
+    return load_match_json(path)
+
+
+def load_match_files(
+    matches_dir: str = "matches",
+    *,
+    use_cache: bool = True,
+    include_aram: bool = True,
+    queue_filter: Optional[Iterable[int]] = None,
+    game_mode_whitelist: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
     """
     Load all match data files from the matches directory.
 
+    Parsed matches are memoized in ``<matches_dir>/.match_cache.json.cache``
+    keyed by file mtime and size, so only new or modified JSON files are
+    re-parsed. Within one process the cache is also kept in memory, so later
+    calls skip reading the cache file; returned match dicts are shared and must not be mutated.
+    Files that do need parsing are read concurrently on a thread pool.
+
+    The filter arguments (same meaning as in ``apply_analysis_filters``, but
+    ARAM is kept by default) let files that need parsing be skipped when their
+    first few KB already show they would be filtered out. This is only a
+    pre-filter: cached matches and files whose header is inconclusive are
+    returned as usual, so callers still apply ``apply_analysis_filters``.
+
     Args:
         matches_dir (str): Directory containing match JSON files
+        use_cache (bool): If False, parse every JSON file and neither read nor
+            update the parsed-match cache
+        include_aram (bool): If False, skip uncached ARAM files unparsed
+        queue_filter (Iterable[int], optional): Skip uncached files whose
+            header shows a queueId outside this set
+        game_mode_whitelist (Iterable[str], optional): Skip uncached files
+            whose header shows a gameMode outside this set
 
     Returns:
         List[Dict]: List of match data dictionaries
@@ -75,25 +181,120 @@ def load_match_files(matches_dir: str = "matches") -> List[Dict[str, Any]]:
         logger.warning(f"Matches directory {matches_dir} does not exist")
         return matches
 
-    for file_path in matches_path.glob("*.json"):
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                match_data = json.load(f)
-                matches.append(match_data)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to load {file_path}: {e}")
+    cache_path = matches_path / MATCH_CACHE_FILENAME
+    memory_key = os.path.abspath(matches_dir)
+    cache: MatchCache = {}
+    if use_cache:
+        cache = _MATCH_MEMORY_CACHE.get(memory_key) or _read_match_cache(cache_path)
+    new_cache: MatchCache = {}
+    dirty = False
+    filters: Optional[Dict[str, Any]] = None
+    if not include_aram or queue_filter or game_mode_whitelist:
+        filters = {
+            "include_aram": include_aram,
+            "allowed_queue_ids": frozenset(queue_filter or ()),
+            "allowed_game_modes": frozenset(game_mode_whitelist or ()),
+        }
+
+    # Cache hits are resolved inline; new or modified files are read and parsed
+    # on a thread pool (workers start only when needed) so their disk reads
+    # overlap. Results keep directory order.
+    pending: List[Tuple["os.DirEntry[str]", Tuple[int, int], Any, Optional["Future[Any]"]]] = []
+    with ThreadPoolExecutor(max_workers=_PARSE_WORKERS) as executor:
+        for dir_entry in _scan_match_files(matches_path):
+            try:
+                st = dir_entry.stat()
+            except OSError as e:
+                logger.warning(f"Failed to load {dir_entry.path}: {e}")
+                continue
+            key = (st.st_mtime_ns, st.st_size)
+            entry = cache.get(dir_entry.name)
+            if entry is not None and entry[:2] == key:
+                pending.append((dir_entry, key, entry[2], None))
+            else:
+                future = executor.submit(_parse_match_file, dir_entry.path, filters)
+                pending.append((dir_entry, key, None, future))
+
+        for dir_entry, key, match_data, future in pending:
+            if future is not None:
+                try:
+                    match_data = future.result()
+                except (json.JSONDecodeError, IOError, EOFError) as e:
+                    logger.warning(f"Failed to load {dir_entry.path}: {e}")
+                    continue
+                if match_data is None:
+                    # Skipped by the header pre-filter (or a bare ``null``)
+                    continue
+                dirty = True
+            new_cache[dir_entry.name] = (key[0], key[1], match_data)
+            matches.append(match_data)
+
+    if use_cache:
+        if dirty or len(new_cache) != len(cache):
+            _write_match_cache(cache_path, new_cache)
+        _MATCH_MEMORY_CACHE[memory_key] = new_cache
 
     logger.info(f"Loaded {len(matches)} match files")
     return matches
 
 
-def analyze_player_performance(matches: List[Dict[str, Any]], player_puuid: str) -> Dict[str, Any]:
+ParticipantIndex = Dict[str, List[Tuple[int, Dict[str, Any]]]]
+
+
+def index_participants(matches: List[Dict[str, Any]]) -> ParticipantIndex:
+    """
+    Build a puuid -> [(match_index, participant), ...] lookup in one pass.
+
+    Build once and pass to ``analyze_player_performance`` when analyzing
+    several players from the same match list.
+    """
+    index: ParticipantIndex = defaultdict(list)
+    for match_idx, match in enumerate(matches):
+        for participant in (match.get("info") or {}).get("participants", ()):
+            puuid = participant.get("puuid")
+            if puuid:
+                index[puuid].append((match_idx, participant))
+    return index
+
+
+# Participant fields read per game by analyze_player_performance, with the
+# defaults used when a (non-standard) participant lacks one of them.
+_PLAYER_FIELDS = (
+    ("win", False),
+    ("kills", 0),
+    ("deaths", 0),
+    ("assists", 0),
+    ("totalDamageDealtToChampions", 0),
+    ("goldEarned", 0),
+)
+_get_player_fields = itemgetter(*(name for name, _ in _PLAYER_FIELDS))
+
+
+def _safe_player_fields(participant: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Fallback for ``_get_player_fields`` when a participant is missing keys."""
+    return tuple(participant.get(name, default) for name, default in _PLAYER_FIELDS)
+
+
+def _player_field_row(participant: Dict[str, Any]) -> Tuple[Any, ...]:
+    try:
+        return _get_player_fields(participant)
+    except KeyError:
+        return _safe_player_fields(participant)
+
+
+def analyze_player_performance(
+    matches: List[Dict[str, Any]],
+    player_puuid: str,
+    participant_index: Optional[ParticipantIndex] = None,
+) -> Dict[str, Any]:
     """
     Analyze performance statistics for a specific player.
 
     Args:
         matches (List[Dict]): List of match data
         player_puuid (str): PUUID of the player to analyze
+        participant_index (ParticipantIndex, optional): Prebuilt
+            ``index_participants(matches)``; built on demand when omitted
 
     Returns:
         Dict[str, Any]: Performance statistics
@@ -112,44 +313,37 @@ def analyze_player_performance(matches: List[Dict[str, Any]], player_puuid: str)
         "total_gold": 0,
     }
 
-    total_duration = 0
-
-    for match in matches:
-        if "info" not in match or "participants" not in match["info"]:
-            continue
-
-        # Find the player's data in this match
-        player_data = None
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_data = participant
-                break
-
-        if not player_data:
-            continue
+    total_duration = 0.0
 
-        stats["total_games"] += 1
+    if participant_index is None:
+        participant_index = index_participants(matches)
 
-        # Basic stats
-        if player_data.get("win", False):
-            stats["wins"] += 1
-        else:
-            stats["losses"] += 1
+    rows = participant_index.get(player_puuid, [])
+    stats["total_games"] = len(rows)
 
-        stats["total_kills"] += player_data.get("kills", 0)
-        stats["total_deaths"] += player_data.get("deaths", 0)
-        stats["total_assists"] += player_data.get("assists", 0)
+    # Champion and role tracking (bulk Counter updates)
+    stats["champions_played"].update(p.get("championName", "Unknown") for _, p in rows)
+    stats["roles_played"].update(p.get("teamPosition", "Unknown") for _, p in rows)
 
-        # Champion and role tracking
-        champion = player_data.get("championName", "Unknown")
-        role = player_data.get("teamPosition", "Unknown")
-        stats["champions_played"][champion] += 1
-        stats["roles_played"][role] += 1
+    if rows:
+        # One (n_games, 6) matrix in ``_PLAYER_FIELDS`` column order, so every
+        # total is a single column sum instead of per-game dict updates.
+        fields = np.array([_player_field_row(p) for _, p in rows], dtype=np.int64)
+        wins, kills, deaths, assists, damage, gold = (int(t) for t in fields.sum(axis=0))
+        durations = np.fromiter(
+            (matches[match_idx]["info"].get("gameDuration", 0) for match_idx, _ in rows),
+            dtype=np.float64,
+            count=len(rows),
+        )
+        total_duration = float(durations.sum())
 
-        # Game metrics
-        total_duration += match["info"].get("gameDuration", 0)
-        stats["total_damage"] += player_data.get("totalDamageDealtToChampions", 0)
-        stats["total_gold"] += player_data.get("goldEarned", 0)
+        stats["wins"] = wins
+        stats["losses"] = len(rows) - wins
+        stats["total_kills"] = kills
+        stats["total_deaths"] = deaths
+        stats["total_assists"] = assists
+        stats["total_damage"] = damage
+        stats["total_gold"] = gold
 
     # Calculate averages
     if stats["total_games"] > 0:
@@ -164,6 +358,81 @@ def analyze_player_performance(matches: List[Dict[str, Any]], player_puuid: str)
     return stats
 
 
+# Riot objective keys -> report keys, in ``MatchArrays.objectives`` column order
+OBJECTIVE_COLUMNS = (
+    ("dragon", "dragons"),
+    ("baron", "barons"),
+    ("riftHerald", "heralds"),
+    ("tower", "towers"),
+)
+
+
+@dataclass
+class MatchArrays:
+    """Per-match team totals in struct-of-arrays form (one row per match with ``info``).
+
+    ``objectives`` is an ``(n_matches, 4)`` int32 matrix whose columns follow
+    ``OBJECTIVE_COLUMNS``, so all objective totals reduce in one pass.
+    """
+
+    game_modes: List[str]
+    game_types: List[str]
+    durations: np.ndarray
+    objectives: np.ndarray
+
+    @property
+    def dragons(self) -> np.ndarray:
+        return self.objectives[:, 0]
+
+    @property
+    def barons(self) -> np.ndarray:
+        return self.objectives[:, 1]
+
+    @property
+    def heralds(self) -> np.ndarray:
+        return self.objectives[:, 2]
+
+    @property
+    def towers(self) -> np.ndarray:
+        return self.objectives[:, 3]
+
+
+def matches_to_arrays(matches: Iterable[Dict[str, Any]]) -> MatchArrays:
+    """
+    Flatten matches into parallel arrays of game metadata and objective totals.
+
+    Objective counts are summed over both teams. Built in a single pass so the
+    aggregation in ``analyze_team_performance`` is a single NumPy reduction.
+    """
+    game_modes: List[str] = []
+    game_types: List[str] = []
+    durations: List[int] = []
+    objective_rows: List[List[int]] = []
+
+    for match in matches:
+        info = match.get("info")
+        if info is None:
+            continue
+
+        game_modes.append(info.get("gameMode", "Unknown"))
+        game_types.append(info.get("gameType", "Unknown"))
+        durations.append(info.get("gameDuration", 0))
+
+        row = [0] * len(OBJECTIVE_COLUMNS)
+        for team in info.get("teams", ()):
+            objectives = team.get("objectives", {})
+            for col, (riot_key, _) in enumerate(OBJECTIVE_COLUMNS):
+                row[col] += objectives.get(riot_key, {}).get("kills", 0)
+        objective_rows.append(row)
+
+    return MatchArrays(
+        game_modes=game_modes,
+        game_types=game_types,
+        durations=np.asarray(durations, dtype=np.int64),
+        objectives=np.asarray(objective_rows, dtype=np.int32).reshape(-1, len(OBJECTIVE_COLUMNS)),
+    )
+
+
 def analyze_team_performance(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Analyze overall team performance metrics.
@@ -174,55 +443,22 @@ def analyze_team_performance(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Team performance statistics
     """
+    arrays = matches_to_arrays(matches)
+    totals = arrays.objectives.sum(axis=0)
     stats: Dict[str, Any] = {
         "total_matches": len(matches),
-        "game_modes": Counter(),
-        "game_types": Counter(),
+        "game_modes": Counter(arrays.game_modes),
+        "game_types": Counter(arrays.game_types),
         "average_duration": 0,
         "objectives": {
-            "dragons": {"total": 0, "avg_per_game": 0},
-            "barons": {"total": 0, "avg_per_game": 0},
-            "heralds": {"total": 0, "avg_per_game": 0},
-            "towers": {"total": 0, "avg_per_game": 0},
+            report_key: {"total": int(total), "avg_per_game": 0}
+            for (_, report_key), total in zip(OBJECTIVE_COLUMNS, totals)
         },
     }
 
-    total_duration = 0
-
-    for match in matches:
-        if "info" not in match:
-            continue
-
-        info = match["info"]
-
-        # Game mode and type tracking
-        stats["game_modes"][info.get("gameMode", "Unknown")] += 1
-        stats["game_types"][info.get("gameType", "Unknown")] += 1
-
-        # Duration tracking
-        duration = info.get("gameDuration", 0)
-        total_duration += duration
-
-        # Objectives tracking (sum both teams)
-        if "teams" in info:
-            for team in info["teams"]:
-                objectives = team.get("objectives", {})
-                stats["objectives"]["dragons"]["total"] += objectives.get("dragon", {}).get(
-                    "kills", 0
-                )
-                stats["objectives"]["barons"]["total"] += objectives.get("baron", {}).get(
-                    "kills", 0
-                )
-                stats["objectives"]["heralds"]["total"] += objectives.get("riftHerald", {}).get(
-                    "kills", 0
-                )
-                stats["objectives"]["towers"]["total"] += objectives.get("tower", {}).get(
-                    "kills", 0
-                )
-
     # Calculate averages
     if stats["total_matches"] > 0:
-        stats["average_duration"] = total_duration / stats["total_matches"]
+        stats["average_duration"] = int(arrays.durations.sum()) / stats["total_matches"]
         for obj_type in stats["objectives"]:
             stats["objectives"][obj_type]["avg_per_game"] = (
                 stats["objectives"][obj_type]["total"] / stats["total_matches"]
@@ -232,57 +468,122 @@ def analyze_team_performance(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 
 def print_player_report(stats: Dict[str, Any], player_name: str):
-    """Print a formatted player performance report."""
-    print(f"\n{'=' * 50}")
-    print(f"PLAYER PERFORMANCE REPORT: {player_name}")
-    print(f"{'=' * 50}")
-
-    print("\n📊 Overall Performance:")
-    print(f"   Total Games: {stats['total_games']}")
-    print(f"   Wins: {stats['wins']} | Losses: {stats['losses']}")
-    print(f"   Win Rate: {stats.get('win_rate', 0):.1%}")
-
-    print("\n⚔️ Combat Stats:")
-    print(
-        f"   Total K/D/A: {stats['total_kills']}/{stats['total_deaths']}/{stats['total_assists']}"
+    """Print a formatted player performance report (built up, then written once)."""
+    lines = [
+        f"\n{'=' * 50}",
+        f"PLAYER PERFORMANCE REPORT: {player_name}",
+        f"{'=' * 50}",
+        "\n📊 Overall Performance:",
+        f"   Total Games: {stats['total_games']}",
+        f"   Wins: {stats['wins']} | Losses: {stats['losses']}",
+        f"   Win Rate: {stats.get('win_rate', 0):.1%}",
+        "\n⚔️ Combat Stats:",
+        f"   Total K/D/A: {stats['total_kills']}/{stats['total_deaths']}/{stats['total_assists']}",
+        f"   Average KDA: {stats.get('average_kda', 0):.2f}",
+        "\n🏆 Champions (Top 5):",
+    ]
+    lines.extend(
+        f"   {champion}: {count} games"
+        for champion, count in stats["champions_played"].most_common(5)
     )
-    print(f"   Average KDA: {stats.get('average_kda', 0):.2f}")
-
-    print("\n🏆 Champions (Top 5):")
-    for champion, count in stats["champions_played"].most_common(5):
-        print(f"   {champion}: {count} games")
-
-    print("\n🎯 Preferred Roles:")
-    for role, count in stats["roles_played"].most_common():
-        print(f"   {role}: {count} games")
-
-    print("\n💰 Performance Metrics:")
-    print(f"   Average Damage: {stats.get('average_damage', 0):,.0f}")
-    print(f"   Average Gold: {stats.get('average_gold', 0):,.0f}")
+    lines.append("\n🎯 Preferred Roles:")
+    lines.extend(f"   {role}: {count} games" for role, count in stats["roles_played"].most_common())
     avg_duration = stats.get("average_game_duration", 0)
-    print(f"   Average Game Duration: {int(avg_duration // 60):.0f}m {int(avg_duration % 60):.0f}s")
+    lines += [
+        "\n💰 Performance Metrics:",
+        f"   Average Damage: {stats.get('average_damage', 0):,.0f}",
+        f"   Average Gold: {stats.get('average_gold', 0):,.0f}",
+        f"   Average Game Duration: {int(avg_duration // 60):.0f}m {int(avg_duration % 60):.0f}s",
+    ]
+    print("\n".join(lines))
 
 
 def print_team_report(stats: Dict[str, Any]):
-    """Print a formatted team performance report."""
-    print("\n" + "=" * 50)
-    print("TEAM PERFORMANCE ANALYSIS")
-    print("=" * 50)
-
-    print("\n📈 Match Overview:")
-    print(f"   Total Matches Analyzed: {stats['total_matches']}")
-    print(
+    """Print a formatted team performance report (built up, then written once)."""
+    lines = [
+        "\n" + "=" * 50,
+        "TEAM PERFORMANCE ANALYSIS",
+        "=" * 50,
+        "\n📈 Match Overview:",
+        f"   Total Matches Analyzed: {stats['total_matches']}",
         f"   Average Game Duration: {stats['average_duration'] // 60:.0f}m "
-        f"{stats['average_duration'] % 60:.0f}s"
+        f"{stats['average_duration'] % 60:.0f}s",
+        "\n🎮 Game Modes:",
+    ]
+    lines.extend(f"   {mode}: {count} matches" for mode, count in stats["game_modes"].most_common())
+    lines.append("\n🏹 Objectives Per Game (Average):")
+    lines.extend(
+        f"   {obj_type.title()}: {data['avg_per_game']:.1f}"
+        for obj_type, data in stats["objectives"].items()
     )
+    print("\n".join(lines))
 
-    print("\n🎮 Game Modes:")
-    for mode, count in stats["game_modes"].most_common():
-        print(f"   {mode}: {count} matches")
 
-    print("\n🏹 Objectives Per Game (Average):")
-    for obj_type, data in stats["objectives"].items():
-        print(f"   {obj_type.title()}: {data['avg_per_game']:.1f}")
+def _fetch_puuid_any_case(
+    game_name: str, tag_line: str, token: str
+) -> Tuple[Optional[str], Optional[Exception]]:
+    """
+    Resolve a Riot ID to a PUUID, retrying other casings when it is not found.
+
+    The ID as typed is tried first, so the common case costs one request. If
+    that fails, the remaining lower/upper/title-case variants are requested
+    concurrently (still paced by the shared rate limiter) and the first
+    success wins. Only "not found" (a 404, which ``fetch_puuid_by_riot_id``
+    raises as ValueError) can depend on casing; other HTTP errors and
+    response-less failures (timeouts, connection errors) would fail the same
+    way for every variant, so they stop the search.
+
+    Returns:
+        Tuple[Optional[str], Optional[Exception]]: ``(puuid, None)`` on
+        success, otherwise ``(None, last_error)``
+    """
+    from stats_visualization import league
+
+    def _other_casing_may_help(exc: Exception) -> bool:
+        if isinstance(exc, ValueError):
+            return True
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        return status == 404
+
+    # Original spelling first; dict.fromkeys drops duplicates, keeping order
+    variants = list(
+        dict.fromkeys(
+            product(
+                (game_name, game_name.lower(), game_name.upper(), game_name.title()),
+                (tag_line, tag_line.lower(), tag_line.upper()),
+            )
+        )
+    )
+    try:
+        return league.fetch_puuid_by_riot_id(game_name, tag_line, token), None
+    except Exception as e:
+        last_error: Exception = e
+        if not _other_casing_may_help(e) or len(variants) == 1:
+            return None, last_error
+
+    logger.debug(
+        "Riot ID %s#%s not resolved as typed; trying %d casing variants",
+        game_name,
+        tag_line,
+        len(variants) - 1,
+    )
+    puuid: Optional[str] = None
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(league.fetch_puuid_by_riot_id, gn_try, tg_try, token)
+            for gn_try, tg_try in variants[1:]
+        ]
+        for future in as_completed(futures):
+            try:
+                puuid = future.result()
+            except Exception as e:
+                last_error = e
+                if _other_casing_may_help(e):
+                    continue
+            break
+        for other in futures:
+            other.cancel()
+    return (puuid, None) if puuid is not None else (None, last_error)
 
 
 def main():
@@ -394,23 +695,47 @@ def main():
             "(default is to clean)."
         ),
     )
+    parser.add_argument(
+        "-C",
+        "--no-match-cache",
+        action="store_true",
+        help=(
+            "Parse every match JSON instead of reusing the parsed-match cache "
+            "(matches/.match_cache.json.cache)."
+        ),
+    )
     args = parser.parse_args()
 
+    # config.env supplies RIOT_API_TOKEN / PUUID_*; load it here rather than
+    # relying on the side effect of importing league.
+    load_dotenv("config.env")
+
     # Set up logging (console) and add file handler to logs/league_stats.log
     level = logging.DEBUG if args.debug else getattr(logging, args.log_level)
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
     setup_file_logging()
     logger.debug("Entered main() with args: %s", args)
 
-    # Load matches (unfiltered first for potential auto-fetch logic)
-    matches = load_match_files(args.matches_dir)
-    logger.debug("Loaded %d raw matches from %s", len(matches), args.matches_dir)
-
     # Derive queue filter list (ranked-only shortcut)
     queue_filter = args.queue
     if args.ranked_only and queue_filter is None:
         queue_filter = [420, 440]
 
+    # Load matches. The player path needs them unfiltered for the auto-fetch
+    # count; team analysis only sees filtered matches, so rejected files can
+    # be skipped before they are parsed.
+    if args.team_analysis:
+        matches = load_match_files(
+            args.matches_dir,
+            use_cache=not args.no_match_cache,
+            include_aram=args.include_aram,
+            queue_filter=queue_filter,
+            game_mode_whitelist=args.modes,
+        )
+    else:
+        matches = load_match_files(args.matches_dir, use_cache=not args.no_match_cache)
+    logger.debug("Loaded %d raw matches from %s", len(matches), args.matches_dir)
+
     # Apply filters early for team analysis path
     filtered_matches = apply_analysis_filters(
         matches,
@@ -430,8 +755,6 @@ def main():
     logger.debug("Running player analysis")
     if args.riot_id:
         logger.debug("Using Riot ID path")
-        from stats_visualization import league
-
         token = os.getenv("RIOT_API_TOKEN")
         logger.debug("RIOT_API_TOKEN present: %s", bool(token))
         if not token:
@@ -439,32 +762,7 @@ def main():
             return
         game_name, tag_line = args.riot_id
         original_label = f"{game_name}#{tag_line}"
-        # Generate case-insensitive variants to try
-        variants: list[tuple[str, str]] = []
-        seen: set[tuple[str, str]] = set()
-        game_name_variants = {
-            game_name,
-            game_name.lower(),
-            game_name.upper(),
-            game_name.title(),
-        }
-        tag_variants = {tag_line, tag_line.lower(), tag_line.upper()}
-        for gn in game_name_variants:
-            for tg in tag_variants:
-                key = (gn, tg)
-                if key not in seen:
-                    seen.add(key)
-                    variants.append(key)
-        player_puuid = None
-        last_error = None
-        for gn_try, tg_try in variants:
-            try:
-                logger.debug("Attempting PUUID fetch with variant %s#%s", gn_try, tg_try)
-                player_puuid = league.fetch_puuid_by_riot_id(gn_try, tg_try, token)
-                break
-            except Exception as e:
-                last_error = e
-                continue
+        player_puuid, last_error = _fetch_puuid_any_case(game_name, tag_line, token)
         if player_puuid is None:
             msg = (
                 f"Failed to fetch PUUID for {original_label} "
@@ -475,9 +773,7 @@ def main():
         player_label = original_label
     elif args.player:
         logger.debug("Using legacy player config path")
-        from stats_visualization import league
-
-        puuids = league.load_player_config()
+        puuids = load_player_config()
         logger.debug("Loaded player config entries: %s", list(puuids.keys()))
         lookup = args.player.lower()
         key_map = {name.lower(): name for name in puuids.keys()}
@@ -495,7 +791,6 @@ def main():
     # Auto-fetch logic if enabled and not enough local matches for this player
     if not args.no_auto_fetch:
         try:
-            from stats_visualization import league as league_mod
             import time
 
             token_af = os.getenv("RIOT_API_TOKEN")
@@ -511,6 +806,8 @@ def main():
                     )
                     started = time.time()
                     try:
+                        from stats_visualization import league as league_mod
+
                         league_mod.ensure_matches_for_player(
                             player_puuid,
                             token_af,
@@ -520,7 +817,9 @@ def main():
                         )
                         duration = time.time() - started
                         # Reload matches after fetch
-                        matches = load_match_files(args.matches_dir)
+                        matches = load_match_files(
+                            args.matches_dir, use_cache=not args.no_match_cache
+                        )
                         # Re-apply filters after fetch
                         filtered_matches = apply_analysis_filters(
                             matches,
@@ -582,6 +881,7 @@ def main():
                 game_mode_whitelist=args.modes,
                 clean=not args.no_clean_output,
                 matches_dir=args.matches_dir,
+                use_cache=not args.no_match_cache,
             )
         except Exception as e:  # pragma: no cover - broad safety
             logger.error("Visualization generation failed: %s", e)
@@ -597,12 +897,16 @@ def generate_all_visuals(
     game_mode_whitelist: Optional[Iterable[str]] = None,
     clean: bool = True,
     matches_dir: str = "matches",
+    use_cache: bool = True,
 ) -> None:
     """Generate the full suite of visualization charts for a player.
 
     Imports each visualization module lazily and invokes its extraction + plot routines.
     A single optional output directory cleanup occurs at the start to avoid wiping
     newly created charts mid-run (visual scripts normally auto-clean individually).
+    Matches are loaded and filtered once and passed to every extractor. Chart
+    data is extracted concurrently on worker threads; plotting itself runs
+    sequentially on the calling thread because pyplot is not thread-safe.
 
     Args:
         player_label: Display label (e.g. Frowtch#blue)
@@ -610,6 +914,8 @@ def generate_all_visuals(
         include_aram / queue_filter / game_mode_whitelist: Filtering options
         clean: If True, remove existing PNGs before generation
         matches_dir: Directory with match JSONs
+        use_cache: If False, parse every match JSON without reading or updating
+            the parsed-match cache (``--no-match-cache``)
     """
     from stats_visualization.utils import clean_output
 
@@ -629,207 +935,123 @@ def generate_all_visuals(
         except Exception as exc:  # pragma: no cover - defensive
             results.append((name, f"fail: {exc}"))
 
-    # 1. Personal performance (trends, champions, roles)
-    from stats_visualization.visualizations import personal_performance as _pp
-
-    _run(
-        "personal_trends",
-        lambda: _pp.plot_performance_trends(
-            player_puuid,
-            player_label,
-            matches_dir,
-            include_aram=include_aram,
-            queue_filter=list(queue_filter) if queue_filter is not None else None,
-            game_mode_whitelist=(
-                list(game_mode_whitelist) if game_mode_whitelist is not None else None
-            ),
-        ),
-    )
-    _run(
-        "personal_champions",
-        lambda: _pp.plot_champion_performance(
-            player_puuid,
-            player_label,
-            matches_dir,
-            include_aram=include_aram,
-            queue_filter=list(queue_filter) if queue_filter is not None else None,
-            game_mode_whitelist=(
-                list(game_mode_whitelist) if game_mode_whitelist is not None else None
-            ),
-        ),
-    )
-    _run(
-        "personal_roles",
-        lambda: _pp.plot_role_performance(
-            player_puuid,
-            player_label,
-            matches_dir,
-            include_aram=include_aram,
-            queue_filter=list(queue_filter) if queue_filter is not None else None,
-            game_mode_whitelist=(
-                list(game_mode_whitelist) if game_mode_whitelist is not None else None
-            ),
-        ),
-    )
-
-    # 2. Kills
-    from stats_visualization.visualizations import graph_kills as _gk
-
-    _run(
-        "kills",
-        lambda: _gk.plot_kills_analysis(
-            player_label,
-            _gk.extract_kills_data(
-                player_puuid,
-                matches_dir,
-                include_aram=include_aram,
-                queue_filter=list(queue_filter) if queue_filter else None,
-                game_mode_whitelist=(list(game_mode_whitelist) if game_mode_whitelist else None),
-            ),
-        ),
-    )
-
-    # 3. Drake control
+    from stats_visualization.visualizations import farming_analysis as _fa
+    from stats_visualization.visualizations import graph_barons_heralds as _bh
     from stats_visualization.visualizations import graph_drakes as _gd
+    from stats_visualization.visualizations import graph_first_bloods as _fb
+    from stats_visualization.visualizations import graph_kills as _gk
+    from stats_visualization.visualizations import jungle_clear_analysis as _jc
+    from stats_visualization.visualizations import objective_analysis as _oa
+    from stats_visualization.visualizations import personal_performance as _pp
 
-    _run(
-        "drakes",
-        lambda: _gd.plot_drake_analysis(
-            player_label,
-            _gd.extract_drake_data(
-                player_puuid,
-                matches_dir,
-                include_aram=include_aram,
-                queue_filter=list(queue_filter) if queue_filter else None,
-                game_mode_whitelist=(list(game_mode_whitelist) if game_mode_whitelist else None),
-            ),
-        ),
+    def _optional(future: "Future[Any]") -> Any:
+        try:
+            return future.result()
+        except Exception:  # pragma: no cover
+            return None
+
+    # Load and filter the matches once; every extractor below works from these
+    # lists instead of re-reading and re-filtering the matches directory.
+    all_matches = load_match_files(matches_dir, use_cache=use_cache)
+    matches = apply_analysis_filters(
+        all_matches,
+        include_aram=include_aram,
+        queue_filter=queue_filter,
+        game_mode_whitelist=game_mode_whitelist,
     )
 
-    # 4. Baron / Herald
-    from stats_visualization.visualizations import graph_barons_heralds as _bh
-
-    _run(
-        "barons_heralds",
-        lambda: _bh.plot_baron_herald_analysis(
-            player_label,
-            _bh.extract_baron_herald_data(
-                player_puuid,
-                matches_dir,
-                include_aram=include_aram,
-                queue_filter=list(queue_filter) if queue_filter else None,
-                game_mode_whitelist=(list(game_mode_whitelist) if game_mode_whitelist else None),
-            ),
-        ),
-    )
+    # Data extraction runs on a thread pool while the charts are drawn here:
+    # pyplot keeps global "current figure" state and is not thread-safe, so
+    # all plotting stays on the calling thread, in the original order.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        kills_f = executor.submit(_gk.extract_kills_data, player_puuid, matches=matches)
+        drakes_f = executor.submit(_gd.extract_drake_data, player_puuid, matches=matches)
+        barons_f = executor.submit(_bh.extract_baron_herald_data, player_puuid, matches=matches)
+        objectives_f = executor.submit(_oa.extract_objective_data, player_puuid, matches=matches)
+        economy_f = executor.submit(_fa.extract_economy_data, player_puuid, matches=matches)
+        # The first-blood chart has never applied the analysis filters
+        first_bloods_f = executor.submit(
+            _fb.extract_early_game_data, player_puuid, matches=all_matches
+        )
+        jungle_f = executor.submit(_jc.extract_jungle_clear_data, player_puuid, matches=matches)
+        lane_f: Optional["Future[Any]"] = None
+        lane_error = ""
+        try:
+            from stats_visualization.visualizations import lane_cs_diff as _lcd
 
-    # 5. Objectives (control, first, correlation)
-    from stats_visualization.visualizations import objective_analysis as _oa
+            lane_f = executor.submit(_lcd.extract_lane_cs_diff_data, player_puuid, matches=matches)
+        except Exception as exc:  # pragma: no cover
+            lane_error = f"fail: {exc}"
 
-    _run(
-        "objectives_control",
-        lambda: _oa.plot_objective_control(
-            player_label,
-            _oa.extract_objective_data(
-                player_puuid,
-                matches_dir,
-                include_aram=include_aram,
-                queue_filter=list(queue_filter) if queue_filter else None,
-                game_mode_whitelist=(list(game_mode_whitelist) if game_mode_whitelist else None),
-            ),
-        ),
-    )
-    # reuse extracted data once for the next two plots to avoid re-loading if desired
-    try:
-        _obj_data_cache = _oa.extract_objective_data(
-            player_puuid,
-            matches_dir,
-            include_aram=include_aram,
-            queue_filter=list(queue_filter) if queue_filter else None,
-            game_mode_whitelist=(list(game_mode_whitelist) if game_mode_whitelist else None),
+        # 1. Personal performance (trends, champions, roles)
+        _run(
+            "personal_trends",
+            lambda: _pp.plot_performance_trends(player_puuid, player_label, matches=matches),
         )
-    except Exception:  # pragma: no cover
-        _obj_data_cache = None
-    if _obj_data_cache:
         _run(
-            "objectives_first",
-            lambda: _oa.plot_first_objectives(player_label, _obj_data_cache),
+            "personal_champions",
+            lambda: _pp.plot_champion_performance(player_puuid, player_label, matches=matches),
         )
         _run(
-            "objectives_correlation",
-            lambda: _oa.plot_objective_win_correlation(player_label, _obj_data_cache),
+            "personal_roles",
+            lambda: _pp.plot_role_performance(player_puuid, player_label, matches=matches),
         )
 
-    # 6. Farming / economy (farming, gold, roles)
-    from stats_visualization.visualizations import farming_analysis as _fa
+        # 2. Kills
+        _run("kills", lambda: _gk.plot_kills_analysis(player_label, kills_f.result()))
 
-    try:
-        _econ = _fa.extract_economy_data(
-            player_puuid,
-            matches_dir,
-            include_aram=include_aram,
-            queue_filter=list(queue_filter) if queue_filter else None,
-            game_mode_whitelist=(list(game_mode_whitelist) if game_mode_whitelist else None),
-        )
-    except Exception:  # pragma: no cover
-        _econ = None
-    if _econ:
-        _run("farming", lambda: _fa.plot_farming_performance(player_label, _econ))
-        _run("gold_efficiency", lambda: _fa.plot_gold_efficiency(player_label, _econ))
+        # 3. Drake control
+        _run("drakes", lambda: _gd.plot_drake_analysis(player_label, drakes_f.result()))
+
+        # 4. Baron / Herald
         _run(
-            "role_economy",
-            lambda: _fa.plot_role_economy_comparison(player_label, _econ),
+            "barons_heralds",
+            lambda: _bh.plot_baron_herald_analysis(player_label, barons_f.result()),
         )
 
-    # 7. First blood / early game
-    from stats_visualization.visualizations import graph_first_bloods as _fb
-
-    _run(
-        "first_bloods",
-        lambda: _fb.plot_first_blood_analysis(
-            player_label,
-            _fb.extract_early_game_data(player_puuid, matches_dir),
-        ),
-    )
-
-    # 8. Jungle clear
-    from stats_visualization.visualizations import jungle_clear_analysis as _jc
+        # 5. Objectives (control, first, correlation) from one extraction
+        _run(
+            "objectives_control",
+            lambda: _oa.plot_objective_control(player_label, objectives_f.result()),
+        )
+        _obj_data = _optional(objectives_f)
+        if _obj_data:
+            _run(
+                "objectives_first",
+                lambda: _oa.plot_first_objectives(player_label, _obj_data),
+            )
+            _run(
+                "objectives_correlation",
+                lambda: _oa.plot_objective_win_correlation(player_label, _obj_data),
+            )
 
-    _run(
-        "jungle_clear",
-        lambda: _jc.plot_jungle_clear_analysis(
-            player_label,
-            _jc.extract_jungle_clear_data(
-                player_puuid,
-                matches_dir,
-                include_aram=include_aram,
-                queue_filter=list(queue_filter) if queue_filter else None,
-                game_mode_whitelist=(list(game_mode_whitelist) if game_mode_whitelist else None),
-            ),
-        ),
-    )
+        # 6. Farming / economy (farming, gold, roles)
+        _econ = _optional(economy_f)
+        if _econ:
+            _run("farming", lambda: _fa.plot_farming_performance(player_label, _econ))
+            _run("gold_efficiency", lambda: _fa.plot_gold_efficiency(player_label, _econ))
+            _run(
+                "role_economy",
+                lambda: _fa.plot_role_economy_comparison(player_label, _econ),
+            )
 
-    # 9. Lane phase CS diff (issue #12)
-    try:
-        from stats_visualization.visualizations import lane_cs_diff as _lcd
+        # 7. First blood / early game
+        _run(
+            "first_bloods",
+            lambda: _fb.plot_first_blood_analysis(player_label, first_bloods_f.result()),
+        )
 
+        # 8. Jungle clear
         _run(
-            "lane_cs_diff",
-            lambda: _lcd.plot_lane_cs_diff(
-                player_label,
-                _lcd.extract_lane_cs_diff_data(
-                    player_puuid,
-                    matches_dir=matches_dir,
-                    include_aram=include_aram,
-                    queue_filter=list(queue_filter) if queue_filter else None,
-                    game_mode_whitelist=(
-                        list(game_mode_whitelist) if game_mode_whitelist else None
-                    ),
-                ),
-            ),
+            "jungle_clear",
+            lambda: _jc.plot_jungle_clear_analysis(player_label, jungle_f.result()),
         )
-    except Exception as exc:  # pragma: no cover
-        results.append(("lane_cs_diff", f"fail: {exc}"))
+
+        # 9. Lane phase CS diff (issue #12)
+        if lane_f is not None:
+            _run("lane_cs_diff", lambda: _lcd.plot_lane_cs_diff(player_label, lane_f.result()))
+        else:  # pragma: no cover
+            results.append(("lane_cs_diff", lane_error))
 
     # Summary
     successes = sum(1 for _, r in results if r == "ok")
@@ -10,6 +10,14 @@ from typing import Any, Dict, Optional, TypedDict
 import asyncio
 import httpx
 import logging
+from stats_visualization.utils import (
+    RIOT_MAX_RETRIES,
+    RIOT_RATE_LIMITER,
+    RIOT_RETRY_STATUSES,
+    json_loads,
+    riot_auth_headers,
+    riot_retry_delay,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,23 +42,36 @@ class RateLimitError(Exception):
 
 
 async def _retryable_get(
-    client: httpx.AsyncClient, url: str, headers: Dict[str, str], *, max_retries: int = 1
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    *,
+    max_retries: int = RIOT_MAX_RETRIES,
 ) -> httpx.Response:
-    response = await client.get(url, headers=headers)
-    if response.status_code == 429 and max_retries > 0:
-        retry_after = int(response.headers.get("Retry-After", "2"))
-        logger.warning(f"429 for {url}. Sleeping {retry_after}s then retrying once.")
-        await asyncio.sleep(retry_after)
-        return await _retryable_get(client, url, headers, max_retries=max_retries - 1)
+    attempt = 0
+    while True:
+        wait = RIOT_RATE_LIMITER.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        response = await client.get(url, headers=headers)
+        if response.status_code not in RIOT_RETRY_STATUSES or attempt >= max_retries:
+            break
+        delay = riot_retry_delay(response.headers, attempt)
+        logger.warning(
+            f"{response.status_code} for {url}. Sleeping {delay:.1f}s then retrying "
+            f"({attempt + 1}/{max_retries})."
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
     response.raise_for_status()
     return response
 
 
 async def fetch_match(match_id: str, token: str, client: httpx.AsyncClient) -> MatchData:
-    headers = {"X-Riot-Token": token}
-    url = f"{API_BASE_URL}{match_id}"
+    headers = riot_auth_headers(token)
+    url = API_BASE_URL + match_id
     resp = await _retryable_get(client, url, headers)
-    data: Dict[str, Any] = resp.json()
+    data: Dict[str, Any] = json_loads(resp.content)
     # Narrow type to MatchData via cast-like structural assignment
     out: MatchData = {"metadata": data.get("metadata", {}), "info": data.get("info", {})}
     if "timeline" in data and isinstance(data["timeline"], dict):
@@ -67,7 +88,7 @@ async def fetch_match(match_id: str, token: str, client: httpx.AsyncClient) -> M
 async def fetch_timeline(
     match_id: str, token: str, client: httpx.AsyncClient
 ) -> Optional[TimelineData]:
-    headers = {"X-Riot-Token": token}
+    headers = riot_auth_headers(token)
     url = TIMELINE_API_URL.format(match_id=match_id)
     try:
         resp = await _retryable_get(client, url, headers)
@@ -76,7 +97,7 @@ async def fetch_timeline(
             logger.info(f"Timeline not found for {match_id} (404)")
             return None
         raise
-    data: Dict[str, Any] = resp.json()
+    data: Dict[str, Any] = json_loads(resp.content)
     return {"metadata": data.get("metadata", {}), "info": data.get("info", {})}
 
 
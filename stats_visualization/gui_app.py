@@ -68,7 +68,8 @@ QUEUE_ID_MAP = {
 
 def _list_pngs() -> list[Path]:
     OUTPUT_DIR.mkdir(exist_ok=True)
-    return sorted(p for p in OUTPUT_DIR.glob("*.png"))
+    with os.scandir(OUTPUT_DIR) as it:
+        return sorted(Path(e.path) for e in it if e.name.endswith(".png") and e.is_file())
 
 
 def _generate_all(
@@ -129,18 +130,7 @@ def _generate_all(
 
 
 def _count_player_matches(puuid: str) -> int:
-    from json import load
-
-    count = 0
-    for fp in Path("matches").glob("*.json"):
-        try:
-            with open(fp, "r", encoding="utf-8") as f:
-                data = load(f)
-            if any(p.get("puuid") == puuid for p in data.get("info", {}).get("participants", [])):
-                count += 1
-        except Exception:  # pragma: no cover
-            continue
-    return count
+    return league.count_player_matches("matches", puuid)
 
 
 def main():  # noqa: C901 (complexity acceptable for UI glue)
@@ -7,19 +7,36 @@ resolver is provided for consistent casing in downstream outputs.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import partial
 from dotenv import load_dotenv
 import time
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 import asyncio
+import gzip
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import importlib.util
 
 import requests
-from stats_visualization.utils import setup_file_logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from stats_visualization.match_index import count_player_matches, match_puuids
+from stats_visualization.utils import (
+    MATCH_FILE_SUFFIXES,
+    RIOT_MAX_RETRIES,
+    RIOT_RATE_LIMITER,
+    RIOT_RETRY_STATUSES,
+    atomic_write_bytes,
+    json_dumps,
+    json_loads,
+    load_player_config,
+    riot_auth_headers,
+    riot_retry_delay,
+    setup_file_logging,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -149,34 +166,11 @@ _fetch_metrics = FetchMetrics()
 def export_metrics_json(filepath: str) -> None:
     """Export global metrics to a JSON file."""
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(_fetch_metrics.to_dict(), f, indent=2)
+        Path(filepath).write_bytes(json_dumps(_fetch_metrics.to_dict(), indent=True))
     except OSError as e:  # pragma: no cover
         logger.error("Failed to export metrics: %s", e)
 
 
-# ---------------------------------------------------------------------------
-# Configuration helpers
-# ---------------------------------------------------------------------------
-def load_player_config() -> Dict[str, str]:
-    """Load player PUUIDs from environment variables.
-
-    Environment variables of the form ``PUUID_<NAME>`` are collected and
-    normalized (``FROWTCH`` -> ``Frowtch``). If none are present a default
-    placeholder mapping is returned (tests rely on key presence only).
-    """
-    mapping: Dict[str, str] = {}
-    prefix = "PUUID_"
-    for key, value in os.environ.items():
-        if key.startswith(prefix) and value:
-            raw = key[len(prefix) :]
-            name = raw.capitalize() if raw.isupper() else raw
-            mapping[name] = value
-    if not mapping:
-        mapping = {"Frowtch": "UNKNOWN", "Overowser": "UNKNOWN", "Suro": "UNKNOWN"}
-    return mapping
-
-
 # ---------------------------------------------------------------------------
 # Validation helpers
 # ---------------------------------------------------------------------------
@@ -184,12 +178,12 @@ def validate_match_data(data: Any) -> bool:
     """Basic validation for match JSON structure used in tests.
 
     Accepts Any, returns True only if keys/info fields expected are present.
+    A handful of top-level lookups only; malformed bytes are already rejected
+    by the JSON parser, so nested structures are not walked.
     """
     if not isinstance(data, dict):
         return False
-    from typing import cast as _cast
-
-    data_dict = _cast(Dict[str, Any], data)
+    data_dict = cast(Dict[str, Any], data)
     info_raw: Any = data_dict.get("info")
     meta_raw: Any = data_dict.get("metadata")
     if not isinstance(info_raw, dict) or not isinstance(meta_raw, dict):
@@ -200,6 +194,55 @@ def validate_match_data(data: Any) -> bool:
 # ---------------------------------------------------------------------------
 # Core HTTP helper
 # ---------------------------------------------------------------------------
+# Shared session so sequential requests reuse pooled keep-alive connections
+# instead of paying a TCP + TLS handshake per call. urllib3 only retries
+# connection-level failures; 429/5xx responses are retried in _riot_get so
+# that every attempt takes a rate-limit token (same policy as async_fetch).
+_HTTP_POOL_SIZE = 20
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=_HTTP_POOL_SIZE,
+        pool_maxsize=_HTTP_POOL_SIZE,
+        max_retries=Retry(
+            total=RIOT_MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+def _riot_get(url: str, headers: Dict[str, str], *, timeout: int) -> requests.Response:
+    """GET ``url`` on the shared session, taking a rate-limit token per attempt.
+
+    429/5xx responses are retried up to ``RIOT_MAX_RETRIES`` times, sleeping
+    for ``Retry-After`` when given, else exponential backoff; the last
+    response is returned for the caller's ``raise_for_status()``.
+    """
+    attempt = 0
+    while True:
+        RIOT_RATE_LIMITER.acquire()
+        resp = _session.get(url, headers=headers, timeout=timeout)
+        if resp.status_code not in RIOT_RETRY_STATUSES or attempt >= RIOT_MAX_RETRIES:
+            return resp
+        delay = riot_retry_delay(resp.headers, attempt)
+        logger.warning(
+            "%s for %s. Sleeping %.1fs then retrying (%d/%d).",
+            resp.status_code,
+            url,
+            delay,
+            attempt + 1,
+            RIOT_MAX_RETRIES,
+        )
+        _fetch_metrics.add_retry()
+        time.sleep(delay)
+        attempt += 1
+
+
 def make_api_request(
     url: str, headers: Dict[str, str], *, timeout: int, request_type: str
 ):  # pragma: no cover (thin wrapper)
@@ -208,7 +251,7 @@ def make_api_request(
     The ``request_type`` argument exists only so tests can patch this function
     and still receive the same signature that older versions provided.
     """
-    resp = requests.get(url, headers=headers, timeout=timeout)
+    resp = _riot_get(url, headers, timeout=timeout)
     resp.raise_for_status()
     return resp
 
@@ -221,14 +264,14 @@ def fetch_puuid_and_name_by_riot_id(
 ) -> tuple[str, str, str]:
     """Return (puuid, canonical_gameName, canonical_tagLine)."""
     url = f"{ACCOUNT_BASE_URL}/{game_name}/{tag_line}"
-    headers = {"X-Riot-Token": token}
+    headers = riot_auth_headers(token)
     try:
         resp = make_api_request(url, headers, timeout=30, request_type="puuid")
     except requests.exceptions.HTTPError as e:  # pragma: no cover (network variability)
         if e.response is not None and e.response.status_code == 404:
             raise ValueError("Player not found") from e
         raise
-    data_json_raw: Any = resp.json()
+    data_json_raw: Any = json_loads(resp.content)
     if not isinstance(data_json_raw, dict) or not all(
         k in data_json_raw for k in ("puuid", "gameName", "tagLine")
     ):
@@ -254,14 +297,14 @@ def fetch_puuid_by_riot_id(game_name: str, tag_line: str, token: str) -> str:
     Raises ValueError("not found") when the player does not exist to satisfy tests.
     """
     url = f"{ACCOUNT_BASE_URL}/{game_name}/{tag_line}"
-    headers = {"X-Riot-Token": token}
+    headers = riot_auth_headers(token)
     try:
         resp = make_api_request(url, headers, timeout=30, request_type="puuid")
     except requests.exceptions.HTTPError as e:
         if e.response is not None and e.response.status_code == 404:
             raise ValueError("Player not found") from e
         raise
-    data_json_raw: Any = resp.json()
+    data_json_raw: Any = json_loads(resp.content)
     if not isinstance(data_json_raw, dict) or "puuid" not in data_json_raw:
         raise ValueError("Invalid response format - missing PUUID")
     data_json: Dict[str, Any] = cast(Dict[str, Any], data_json_raw)
@@ -271,36 +314,54 @@ def fetch_puuid_by_riot_id(game_name: str, tag_line: str, token: str) -> str:
 # ---------------------------------------------------------------------------
 # Match & timeline fetchers
 # ---------------------------------------------------------------------------
+_MATCH_IDS_PAGE_SIZE = 100  # Riot's maximum ``count`` per match-ids request
+
+
+def _fetch_match_id_page(puuid: str, start: int, count: int, headers: Dict[str, str]) -> List[str]:
+    url = f"{MATCH_HISTORY_URL}{puuid}/ids?start={start}&count={count}"
+    resp = make_api_request(url, headers, timeout=30, request_type="match_ids")
+    data_json_raw: Any = json_loads(resp.content)
+    if not isinstance(data_json_raw, list):
+        raise ValueError("Match history response was not a list")
+    data_json: List[str] = cast(List[str], data_json_raw)
+    return [str(mid) for mid in data_json]
+
+
 def fetch_match_history(puuid: str, count: int, token: str) -> List[str]:
+    """Return up to ``count`` recent match IDs for ``puuid``, newest first.
+
+    Requests above 100 IDs are split into pages. The first page is fetched
+    alone: if it comes back short, the player's history ends there and no
+    further requests are spent. Otherwise the remaining pages are fetched
+    concurrently on the pooled session; results are concatenated in order and
+    truncated at the first short page.
+    """
     if count <= 0:
         raise ValueError("Count must be positive")
-    headers = {"X-Riot-Token": token}
-    out: List[str] = []
-    start = 0
-    remaining = count
-    while remaining > 0:
-        batch = min(remaining, 100)
-        url = f"{MATCH_HISTORY_URL}{puuid}/ids?start={start}&count={batch}"
-        resp = make_api_request(url, headers, timeout=30, request_type="match_ids")
-        data_json_raw: Any = resp.json()
-        if not isinstance(data_json_raw, list):
-            raise ValueError("Match history response was not a list")
-        data_json: List[str] = cast(List[str], data_json_raw)
-        ids = [str(mid) for mid in data_json]
+    headers = riot_auth_headers(token)
+    pages = [
+        (start, min(_MATCH_IDS_PAGE_SIZE, count - start))
+        for start in range(0, count, _MATCH_IDS_PAGE_SIZE)
+    ]
+    out = _fetch_match_id_page(puuid, *pages[0], headers)
+    if len(pages) == 1 or len(out) < pages[0][1]:
+        return out
+    rest = pages[1:]
+    with ThreadPoolExecutor(max_workers=min(len(rest), _HTTP_POOL_SIZE)) as ex:
+        results = list(ex.map(lambda page: _fetch_match_id_page(puuid, *page, headers), rest))
+    for (_, batch), ids in zip(rest, results):
         out.extend(ids)
         if len(ids) < batch:
             break
-        start += batch
-        remaining -= batch
     return out
 
 
 def fetch_match_data(match_id: str, token: str) -> Dict[str, Any]:
-    headers = {"X-Riot-Token": token}
-    url = f"{API_REGION_BASE}{match_id}"
-    resp = requests.get(url, headers=headers, timeout=30)
+    headers = riot_auth_headers(token)
+    url = API_REGION_BASE + match_id
+    resp = _riot_get(url, headers, timeout=30)
     resp.raise_for_status()
-    data_raw: Any = resp.json()
+    data_raw: Any = json_loads(resp.content)
     if not isinstance(data_raw, dict):
         raise ValueError("Match data response was not a JSON object")
     data: Dict[str, Any] = cast(Dict[str, Any], data_raw)
@@ -308,26 +369,33 @@ def fetch_match_data(match_id: str, token: str) -> Dict[str, Any]:
 
 
 def fetch_timeline_data(match_id: str, token: str) -> Optional[Dict[str, Any]]:
-    headers = {"X-Riot-Token": token}
+    headers = riot_auth_headers(token)
     url = TIMELINE_API_URL.format(match_id=match_id)
     try:
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = _riot_get(url, headers, timeout=30)
         resp.raise_for_status()
     except requests.exceptions.HTTPError as e:  # pragma: no cover
         if e.response is not None and e.response.status_code == 404:
             logger.info("Timeline not found for %s", match_id)
             return None
         raise
-    data_raw: Any = resp.json()
+    data_raw: Any = json_loads(resp.content)
     if not isinstance(data_raw, dict):
         return None
     data: Dict[str, Any] = cast(Dict[str, Any], data_raw)
     return data
 
 
+# Runs the timeline GET of standalone fetch_match_with_timeline calls; threads
+# start on first use. process_matches schedules timelines on its own pool.
+_TIMELINE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="riot-timeline")
+
+
 def fetch_match_with_timeline(match_id: str, token: str) -> Dict[str, Any]:
+    """Fetch a match and its timeline, issuing the two independent GETs concurrently."""
+    timeline_future = _TIMELINE_EXECUTOR.submit(fetch_timeline_data, match_id, token)
     match_data = fetch_match_data(match_id, token)
-    timeline = fetch_timeline_data(match_id, token)
+    timeline = timeline_future.result()
     if timeline:
         match_data["timeline"] = timeline
     return match_data
@@ -336,28 +404,147 @@ def fetch_match_with_timeline(match_id: str, token: str) -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 # Persistence helpers
 # ---------------------------------------------------------------------------
-def save_match_data(match_id: str, data: Dict[str, Any]) -> None:
+def save_match_data(
+    match_id: str, data: Dict[str, Any], *, pretty: bool = False, compress: bool = False
+) -> None:
+    """Write ``data`` to ``matches/<match_id>.json``.
+
+    Files are written as compact JSON (smaller and faster to write/parse);
+    ``pretty=True`` indents with two spaces for human inspection. The write is
+    atomic, so an interrupted run never leaves a truncated match file behind;
+    it is not fsynced per file, since a match lost to a power cut is simply
+    fetched again (empty files are never treated as cached).
+    ``compress=True`` writes ``<match_id>.json.gz`` instead (gzip level 1),
+    removing any uncompressed copy so each match is stored once.
+    """
     Path(MATCHES_DIR).mkdir(exist_ok=True)
-    fp = Path(MATCHES_DIR) / f"{match_id}.json"
-    with open(fp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
-
-
-def process_matches(match_ids: List[str], token: str, use_cache: bool = True) -> None:
-    for match_id in match_ids:
-        if use_cache:
-            fp = Path(MATCHES_DIR) / f"{match_id}.json"
-            if fp.exists():
-                try:
-                    with open(fp, "r", encoding="utf-8") as f:
-                        cached = json.load(f)
-                    if validate_match_data(cached):
-                        continue
-                except Exception:  # pragma: no cover
-                    pass
-        # Tests patch fetch_match_data and save_match_data; keep it simple
-        data = fetch_match_data(match_id, token)
-        save_match_data(match_id, data)
+    plain = Path(MATCHES_DIR) / f"{match_id}.json"
+    gz = plain.with_name(plain.name + ".gz")
+    payload = json_dumps(data, indent=pretty)
+    if compress:
+        atomic_write_bytes(gz, gzip.compress(payload, compresslevel=1), fsync=False)
+        plain.unlink(missing_ok=True)
+    else:
+        atomic_write_bytes(plain, payload, fsync=False)
+        gz.unlink(missing_ok=True)
+
+
+def _cached_match_path(match_id: str) -> Optional[Path]:
+    """Return the non-empty ``.json`` or ``.json.gz`` file cached for ``match_id``."""
+    for suffix in MATCH_FILE_SUFFIXES:
+        fp = Path(MATCHES_DIR) / f"{match_id}{suffix}"
+        try:
+            if fp.stat().st_size > 0:
+                return fp
+        except OSError:
+            continue
+    return None
+
+
+def _is_cached_match(match_id: str) -> bool:
+    """Return True if a non-empty cached file exists for ``match_id``.
+
+    Just ``stat()`` calls instead of parsing the file: the fetch paths only
+    need to know whether to skip the download, never the cached payload itself.
+    """
+    return _cached_match_path(match_id) is not None
+
+
+def _process_one(
+    match_id: str,
+    token: str,
+    use_cache: bool,
+    include_timeline: bool = False,
+    pretty: bool = False,
+    compress: bool = False,
+    puuid_to_count: Optional[str] = None,
+    timeline_future: Optional["Future[Optional[Dict[str, Any]]]"] = None,
+) -> Tuple[str, bool, bool, bool]:
+    """Fetch and save a single match.
+
+    With ``include_timeline``, the timeline comes from ``timeline_future`` when
+    the caller already scheduled its GET, else from ``fetch_match_with_timeline``.
+
+    Returns ``(match_id, success, from_cache, has_puuid)`` where ``has_puuid``
+    is True when a newly saved match includes ``puuid_to_count``.
+    """
+    if use_cache and _is_cached_match(match_id):
+        logger.info("Using cached data for %s", match_id)
+        return match_id, True, True, False
+    try:
+        if include_timeline and timeline_future is None:
+            data = fetch_match_with_timeline(match_id, token)
+        else:
+            data = fetch_match_data(match_id, token)
+            timeline = timeline_future.result() if timeline_future is not None else None
+            if timeline:
+                data["timeline"] = timeline
+        save_match_data(match_id, data, pretty=pretty, compress=compress)
+    except (requests.exceptions.RequestException, ValueError, OSError) as e:
+        logger.error("Failed to fetch %s: %s", match_id, e)
+        return match_id, False, False, False
+    return match_id, True, False, puuid_to_count in match_puuids(data)
+
+
+def process_matches(
+    match_ids: List[str],
+    token: str,
+    use_cache: bool = True,
+    max_workers: int = _HTTP_POOL_SIZE,
+    *,
+    include_timeline: bool = False,
+    pretty: bool = False,
+    compress: bool = False,
+    puuid_to_count: Optional[str] = None,
+) -> int:
+    """Fetch and save ``match_ids`` on a thread pool sharing the pooled session.
+
+    Each request spends nearly all its time waiting on the network, so threads
+    give most of the async path's concurrency without requiring httpx. With
+    ``include_timeline`` each timeline GET is a separate task on the same pool,
+    so at most ``max_workers`` requests are in flight. Failed matches are
+    logged and skipped. Returns how many newly saved matches include
+    ``puuid_to_count`` (checked on the in-memory payload; 0 if unset).
+    """
+    if not match_ids:
+        return 0
+    cached = failed = hits = 0
+    tasks = len(match_ids) * (2 if include_timeline else 1)
+    workers = max(1, min(max_workers, tasks))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = []
+        for mid in match_ids:
+            timeline_future = None
+            if include_timeline and not (use_cache and _is_cached_match(mid)):
+                # Submitted right before the match task that waits on it: the
+                # pool starts tasks in FIFO order, so it is already running (or
+                # done) by then and the wait can never deadlock the pool.
+                timeline_future = ex.submit(fetch_timeline_data, mid, token)
+            futures.append(
+                ex.submit(
+                    _process_one,
+                    mid,
+                    token,
+                    use_cache,
+                    include_timeline,
+                    pretty,
+                    compress,
+                    puuid_to_count,
+                    timeline_future,
+                )
+            )
+        for fut in as_completed(futures):
+            _, success, from_cache, has_puuid = fut.result()
+            cached += from_cache
+            failed += not success
+            hits += has_puuid
+    logger.info(
+        "Processing complete. Successful: %d, Failed: %d, Cached: %d",
+        len(match_ids) - failed,
+        failed,
+        cached,
+    )
+    return hits
 
 
 # ---------------------------------------------------------------------------
@@ -373,26 +560,34 @@ def ensure_matches_for_player(
 ) -> int:
     Path(matches_dir).mkdir(exist_ok=True)
 
-    def count_cached() -> int:
-        total = 0
-        for fp in Path(matches_dir).glob("*.json"):
-            try:
-                with open(fp, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if any(
-                    p.get("puuid") == puuid for p in data.get("info", {}).get("participants", [])
-                ):
-                    total += 1
-            except Exception:  # pragma: no cover
-                continue
-        return total
-
-    current = count_cached()
+    current = count_player_matches(matches_dir, puuid, limit=min_matches)
     if current >= min_matches:
         return current
     ids = fetch_match_history(puuid, fetch_count, token)
-    process_matches(ids, token, use_cache=True)
-    return count_cached()
+    # New matches are counted from the fetched payloads instead of rescanning the directory
+    return current + _fetch_and_save_matches(ids, token, puuid_to_count=puuid)
+
+
+def _fetch_and_save_matches(
+    match_ids: List[str], token: str, puuid_to_count: Optional[str] = None
+) -> int:
+    """Fetch ``match_ids`` concurrently when possible, else serially.
+
+    Uses the httpx-based ``async_process_matches`` when httpx is installed and
+    no event loop is already running in this thread; otherwise falls back to
+    the synchronous ``process_matches``. Returns how many newly saved matches
+    include ``puuid_to_count``.
+    """
+    if importlib.util.find_spec("httpx") is not None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                async_process_matches(
+                    match_ids, token, use_cache=True, puuid_to_count=puuid_to_count
+                )
+            )
+    return process_matches(match_ids, token, use_cache=True, puuid_to_count=puuid_to_count)
 
 
 __all__ = [
@@ -421,10 +616,14 @@ async def async_process_matches(
     use_cache: bool = True,
     include_timeline: bool = False,
     concurrency: int = 10,
-) -> None:
+    pretty: bool = False,
+    compress: bool = False,
+    puuid_to_count: Optional[str] = None,
+) -> int:
     """Fetch and save matches concurrently using httpx and async helpers.
 
     Keeps the public sync API intact for tests; only the CLI uses this by default.
+    Returns how many newly saved matches include ``puuid_to_count``.
     """
     try:
         import httpx as _httpx
@@ -440,37 +639,42 @@ async def async_process_matches(
     Path(MATCHES_DIR).mkdir(exist_ok=True)
 
     sem = asyncio.Semaphore(max(1, concurrency))
+    loop = asyncio.get_running_loop()
 
     async with _httpx.AsyncClient(timeout=30) as client:
 
-        async def _worker(mid: str) -> None:
-            if use_cache:
-                fp = Path(MATCHES_DIR) / f"{mid}.json"
-                if fp.exists():
-                    try:
-                        with open(fp, "r", encoding="utf-8") as f:
-                            cached = json.load(f)
-                        if validate_match_data(cached):
-                            return
-                    except Exception:  # pragma: no cover
-                        pass
+        async def _fetch(mid: str) -> Optional[Dict[str, Any]]:
             t0 = time.time()
             try:
                 if include_timeline:
                     data = await _af_fetch_match_with_timeline(mid, token, client)
                 else:
                     data = await _af_fetch_match(mid, token, client)
-                save_match_data(mid, cast(Dict[str, Any], data))
+                return cast(Dict[str, Any], data)
             except _httpx.HTTPError as e:  # pragma: no cover (network variability)
                 logger.error("Failed to fetch %s: %s", mid, e)
+                return None
             finally:
                 _fetch_metrics.add_request_latency(time.time() - t0, phase="match_details")
 
-        async def _bounded(mid: str) -> None:
+        async def _bounded(mid: str) -> bool:
+            # Cache checks and file writes are blocking; run them in the default
+            # thread pool so they don't stall other in-flight requests. Only the
+            # HTTP fetch holds a semaphore slot, so the next download starts
+            # while this match is still being serialized and written.
+            if use_cache and await loop.run_in_executor(None, _is_cached_match, mid):
+                return False
             async with sem:
-                await _worker(mid)
+                data = await _fetch(mid)
+            if data is None:
+                return False
+            await loop.run_in_executor(
+                None, partial(save_match_data, mid, data, pretty=pretty, compress=compress)
+            )
+            return puuid_to_count in match_puuids(data)
 
-        await asyncio.gather(*(_bounded(m) for m in match_ids))
+        results = await asyncio.gather(*(_bounded(m) for m in match_ids))
+    return sum(results)
 
 
 if __name__ == "__main__":  # Simple CLI for direct execution
@@ -503,6 +707,16 @@ if __name__ == "__main__":  # Simple CLI for direct execution
         action="store_true",
         help="Also fetch timeline data (slower and may 404 for some matches)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented match JSON for human inspection (default: compact)",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Store match files gzip-compressed as <id>.json.gz",
+    )
 
     args = parser.parse_args()
 
@@ -540,27 +754,13 @@ if __name__ == "__main__":  # Simple CLI for direct execution
                 "Install 'httpx' to enable async."
             )
         if use_sync:
-            for idx, mid in enumerate(ids, start=1):
-                logger.info("Processing match %d/%d: %s", idx, len(ids), mid)
-                if not args.no_cache:
-                    fp = Path(MATCHES_DIR) / f"{mid}.json"
-                    if fp.exists():
-                        logger.info("Using cached data for %s", mid)
-                        continue
-                data = fetch_match_data(mid, token)
-                if args.include_timeline:
-                    logger.info("Fetching timeline data for %s", mid)
-                    tl = fetch_timeline_data(mid, token)
-                    if tl:
-                        data["timeline"] = tl
-                        logger.info("Successfully combined match and timeline data for %s", mid)
-                save_match_data(mid, data)
-                logger.info("Saved match data to %s/%s.json", MATCHES_DIR, mid)
-            logger.info(
-                "Processing complete. Successful: %d, Failed: %d, Cached: %d",
-                len(ids),
-                0,
-                0,
+            process_matches(
+                ids,
+                token,
+                use_cache=not args.no_cache,
+                include_timeline=args.include_timeline,
+                pretty=args.pretty,
+                compress=args.compress,
             )
         else:
             asyncio.run(
@@ -569,6 +769,8 @@ if __name__ == "__main__":  # Simple CLI for direct execution
                     token,
                     use_cache=not args.no_cache,
                     include_timeline=args.include_timeline,
+                    pretty=args.pretty,
+                    compress=args.compress,
                 )
             )
     except Exception as e:  # pragma: no cover - CLI runtime errors
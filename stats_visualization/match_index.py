@@ -0,0 +1,123 @@
+"""Persistent PUUID -> match file index for the local match cache.
+
+Counting a player's matches used to read every file in ``matches/``. The
+index (``matches/.match_index.sqlite``) records which PUUIDs appear in each
+match file together with the file's mtime/size, so a count only has to parse
+files that are new or changed since the last call and is otherwise a single
+``SELECT COUNT(*)``. The index is derived data: it is rebuilt on demand and is
+safe to delete.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from stats_visualization.utils import (
+    MATCH_FILE_SUFFIXES,
+    count_player_match_files,
+    load_match_json,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".match_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+CREATE TABLE IF NOT EXISTS pm (puuid TEXT, name TEXT, PRIMARY KEY (puuid, name));
+CREATE INDEX IF NOT EXISTS pm_name ON pm (name);
+"""
+
+
+def match_puuids(data: Any) -> Iterable[str]:
+    """Return the participant PUUIDs of a parsed match payload."""
+    if not isinstance(data, dict):
+        return ()
+    meta_ids = (data.get("metadata") or {}).get("participants")
+    if isinstance(meta_ids, list) and meta_ids:
+        return {p for p in meta_ids if isinstance(p, str)}
+    participants = (data.get("info") or {}).get("participants") or ()
+    return {p["puuid"] for p in participants if isinstance(p, dict) and p.get("puuid")}
+
+
+def _file_puuids(path: Path) -> Iterable[str]:
+    """Read and parse one match file; unreadable files yield no PUUIDs."""
+    try:
+        return match_puuids(load_match_json(path))
+    except (ValueError, OSError, EOFError) as e:
+        logger.warning("Failed to index %s: %s", path.name, e)
+        return ()
+
+
+def _scan(matches_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """Map match file name -> (mtime_ns, size) for files in ``matches_dir``."""
+    out: Dict[str, Tuple[int, int]] = {}
+    with os.scandir(matches_dir) as it:
+        for entry in it:
+            if entry.name.endswith(MATCH_FILE_SUFFIXES) and entry.is_file():
+                st = entry.stat()
+                out[entry.name] = (st.st_mtime_ns, st.st_size)
+    return out
+
+
+def refresh_index(matches_dir: str | Path = "matches") -> sqlite3.Connection:
+    """Bring the index in line with ``matches_dir`` and return an open connection.
+
+    Only files that are new or whose mtime/size changed are parsed; rows for
+    deleted files are dropped. Unreadable files are indexed with no PUUIDs.
+    Changed files are read on a thread pool so disk reads overlap with parsing
+    and the (single-threaded) SQLite writes.
+    """
+    matches_path = Path(matches_dir)
+    conn = sqlite3.connect(matches_path / INDEX_FILENAME, timeout=30)
+    try:
+        conn.executescript(_SCHEMA)
+        on_disk = _scan(matches_path)
+        indexed = {
+            name: (mtime_ns, size)
+            for name, mtime_ns, size in conn.execute("SELECT name, mtime_ns, size FROM files")
+        }
+        stale = [name for name in indexed if on_disk.get(name) != indexed[name]]
+        fresh = [name for name, sig in on_disk.items() if indexed.get(name) != sig]
+        with conn, ThreadPoolExecutor(max_workers=min(32, len(fresh) or 1)) as ex:
+            conn.executemany("DELETE FROM files WHERE name = ?", ((n,) for n in stale))
+            conn.executemany("DELETE FROM pm WHERE name = ?", ((n,) for n in stale))
+            parsed = ex.map(_file_puuids, (matches_path / name for name in fresh))
+            for name, puuids in zip(fresh, parsed):
+                conn.execute("INSERT INTO files VALUES (?, ?, ?)", (name, *on_disk[name]))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO pm VALUES (?, ?)", ((p, name) for p in puuids)
+                )
+        if fresh or stale:
+            logger.debug("Match index: %d file(s) indexed, %d dropped", len(fresh), len(stale))
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def count_player_matches(matches_dir: str | Path, puuid: str, limit: Optional[int] = None) -> int:
+    """Return how many match files in ``matches_dir`` include ``puuid``.
+
+    Falls back to a direct file scan if the index cannot be opened or
+    written (e.g. read-only directory); ``limit`` lets that scan stop early
+    once enough matches are found (see ``count_player_match_files``). A
+    missing directory counts as 0.
+    """
+    if not Path(matches_dir).is_dir():
+        return 0
+    try:
+        conn = refresh_index(matches_dir)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Match index unavailable (%s); scanning files instead", e)
+        return count_player_match_files(matches_dir, puuid, limit)
+    try:
+        row = conn.execute("SELECT COUNT(*) FROM pm WHERE puuid = ?", (puuid,)).fetchone()
+    finally:
+        conn.close()
+    return int(row[0])
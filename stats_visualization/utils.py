@@ -2,12 +2,286 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
+import gzip
+import json
 import logging
+import mmap
 import os
+import re
+import threading
+import time
 from typing import Optional
 from matplotlib.figure import Figure
-from typing import Iterable, Sequence, Any
+from typing import AbstractSet, Iterable, Sequence, Any
+
+try:  # Optional fast JSON backend; stdlib json is used when absent
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON text/bytes, using orjson when installed.
+
+    Decode errors subclass ``json.JSONDecodeError`` with either backend.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``data`` to UTF-8 JSON bytes, using orjson when installed.
+
+    ``indent=True`` pretty-prints with two spaces.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=8)
+def riot_auth_headers(token: str) -> dict[str, str]:
+    """Return the ``X-Riot-Token`` header dict for ``token``, built once per token.
+
+    The same dict is shared by every request; copy it before adding headers.
+    """
+    return {"X-Riot-Token": token}
+
+
+# Match files are stored as ``<id>.json`` or, when compressed, ``<id>.json.gz``.
+MATCH_FILE_SUFFIXES = (".json", ".json.gz")
+
+
+def read_match_bytes(path: str | Path) -> bytes:
+    """Return the JSON bytes of a match file, gunzipping ``.gz`` files."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if str(path).endswith(".gz"):
+        return gzip.decompress(raw)
+    return raw
+
+
+# Uncompressed match files at least this large are parsed straight from a
+# read-only mmap when orjson is available (it accepts buffer objects), which
+# skips copying the file into a ``bytes`` object first.
+_MMAP_MIN_SIZE = 32 * 1024
+
+
+def load_match_json(path: str | Path) -> Any:
+    """Read and parse a ``.json`` / ``.json.gz`` match file.
+
+    Raises the same errors as ``json_loads(read_match_bytes(path))``.
+    """
+    if _orjson is None or str(path).endswith(".gz"):
+        return json_loads(read_match_bytes(path))
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return _orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _orjson.loads(view)
+
+
+def find_participant(match: dict[str, Any], puuid: str) -> Optional[dict[str, Any]]:
+    """Return the ``info.participants`` entry for ``puuid`` in ``match``, or None.
+
+    Riot lists ``metadata.participants`` PUUIDs in the same order as
+    ``info.participants``, so one C-level ``list.index`` replaces a ``.get``
+    per participant. The hit is verified, and payloads whose metadata does not
+    line up with ``info`` fall back to the linear scan.
+    """
+    info = match.get("info")
+    if not isinstance(info, dict):
+        return None
+    participants = info.get("participants")
+    if not isinstance(participants, list):
+        return None
+    meta_ids = (match.get("metadata") or {}).get("participants")
+    if isinstance(meta_ids, list) and len(meta_ids) == len(participants):
+        try:
+            candidate = participants[meta_ids.index(puuid)]
+        except ValueError:
+            return None
+        if isinstance(candidate, dict) and candidate.get("puuid") == puuid:
+            return candidate
+    for p in participants:
+        if isinstance(p, dict) and p.get("puuid") == puuid:
+            return p
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket pacing requests to ``rate`` per second.
+
+    Up to ``capacity`` calls pass immediately; later calls reserve a token and
+    wait until it has refilled, so concurrent workers share one budget instead
+    of bursting into HTTP 429 responses.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Riot development keys allow 20 requests per second (and 100 per 2 minutes,
+# left to the Retry-After handling). Shared by the sync and async fetchers.
+RIOT_RATE_LIMITER = TokenBucket(rate=20, capacity=20)
+
+# Retry policy for Riot API responses, shared by the sync and async fetchers.
+# Every attempt (including retries) takes its own RIOT_RATE_LIMITER token.
+RIOT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RIOT_MAX_RETRIES = 5
+_RETRY_BACKOFF_FACTOR = 0.5
+
+
+def riot_retry_delay(headers: Any, attempt: int) -> float:
+    """Seconds to wait before retry ``attempt``: ``Retry-After`` if given, else exponential backoff."""
+    try:
+        return max(0.0, float(headers["Retry-After"]))
+    except (KeyError, TypeError, ValueError):
+        return _RETRY_BACKOFF_FACTOR * (2**attempt)
+
+
+def atomic_write_bytes(path: str | Path, data: bytes, *, fsync: bool = True) -> None:
+    """Write ``data`` to ``path`` so readers see either the old or the new file.
+
+    The bytes go to a sibling temp file (unique per process/thread, so
+    concurrent writers never share one), are fsynced, and then
+    ``os.replace``-d over the target; an interrupted write leaves at most a
+    stray ``.tmp`` file rather than a truncated ``path``.
+
+    ``fsync=False`` skips the flush to disk. The rename still keeps other
+    processes from ever seeing a partial file; only power-loss durability is
+    given up, which suits re-downloadable cache files written in bulk.
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=1)
+def load_player_config() -> dict[str, str]:
+    """Load player PUUIDs from environment variables.
+
+    Environment variables of the form ``PUUID_<NAME>`` are collected and
+    normalized (``FROWTCH`` -> ``Frowtch``). If none are present a default
+    placeholder mapping is returned (tests rely on key presence only).
+
+    Defined here and re-exported by ``league`` so callers that only need the
+    name -> PUUID mapping avoid importing the HTTP client module.
+
+    The result is memoized for the life of the process (callers must not
+    mutate it); restart, or call ``load_player_config.cache_clear()``, to
+    pick up environment changes.
+    """
+    mapping: dict[str, str] = {}
+    prefix = "PUUID_"
+    for key, value in os.environ.items():
+        if key.startswith(prefix) and value:
+            raw = key[len(prefix) :]
+            name = raw.capitalize() if raw.isupper() else raw
+            mapping[name] = value
+    if not mapping:
+        mapping = {"Frowtch": "UNKNOWN", "Overowser": "UNKNOWN", "Suro": "UNKNOWN"}
+    return mapping
+
+
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+
+def _file_mentions(path: str, needle: bytes) -> bool:
+    """Return True as soon as ``needle`` is seen while streaming ``path``.
+
+    Riot match files start with ``metadata.participants``, so a player's own
+    matches usually answer within the first chunk instead of reading (and, for
+    ``.gz`` files, decompressing) the whole payload, which can be megabytes
+    when a timeline is embedded.
+    """
+    overlap = len(needle) - 1
+    opener = gzip.open if path.endswith(".gz") else open
+    try:
+        with opener(path, "rb") as f:
+            tail = b""
+            while True:
+                chunk = f.read(_SCAN_CHUNK_SIZE)
+                if not chunk:
+                    return False
+                window = tail + chunk
+                if needle in window:
+                    return True
+                tail = window[-overlap:] if overlap else b""
+    except (OSError, EOFError):
+        return False
+
+
+def count_player_match_files(
+    matches_dir: str | Path, puuid: str, limit: Optional[int] = None
+) -> int:
+    """Count match files (``*.json`` / ``*.json.gz``) in ``matches_dir`` that mention ``puuid``.
+
+    Searches the raw bytes for the quoted PUUID instead of parsing each file:
+    only membership is needed, and a PUUID string only appears in matches the
+    player took part in. Files are read on a thread pool so disk reads overlap.
+    The listing uses ``os.scandir`` and plain string paths, so no per-file
+    ``Path`` objects or extra ``stat`` calls are made. Unreadable files are skipped.
+
+    With ``limit``, reading stops once that many matches are found and the
+    result is a lower bound (``>= limit``) rather than the exact total.
+    """
+    try:
+        with os.scandir(matches_dir) as it:
+            files = [
+                e.path
+                for e in it
+                if e.name.endswith(MATCH_FILE_SUFFIXES) and e.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return 0
+    if not files:
+        return 0
+    needle = f'"{puuid}"'.encode("utf-8")
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as ex:
+        if limit is None:
+            return sum(ex.map(partial(_file_mentions, needle=needle), files))
+        futures = [ex.submit(_file_mentions, fp, needle) for fp in files]
+        found = 0
+        for fut in as_completed(futures):
+            found += fut.result()
+            if found >= limit:
+                for pending in futures:
+                    pending.cancel()
+                break
+        return found
 
 
 def clean_output(output_dir: str | Path = "output") -> int:
@@ -15,13 +289,15 @@ def clean_output(output_dir: str | Path = "output") -> int:
 
     Returns number of files removed. Silently returns 0 if directory missing.
     """
-    p = Path(output_dir)
-    if not p.exists():
+    try:
+        with os.scandir(output_dir) as it:
+            pngs = [e.path for e in it if e.name.endswith(".png")]
+    except (FileNotFoundError, NotADirectoryError):
         return 0
     count = 0
-    for f in p.glob("*.png"):
+    for f in pngs:
         try:
-            f.unlink()
+            os.unlink(f)
             count += 1
         except OSError:
             pass
@@ -32,6 +308,13 @@ def clean_output(output_dir: str | Path = "output") -> int:
     return count
 
 
+def _as_filter_set(values: Optional[Iterable[Any]]) -> Optional[AbstractSet[Any]]:
+    """Return ``values`` as a set (reusing one passed in), or None for no/empty filter."""
+    if not values:
+        return None
+    return values if isinstance(values, AbstractSet) else set(values)
+
+
 def filter_matches(
     matches: Sequence[dict[str, Any]],
     *,
@@ -53,8 +336,8 @@ def filter_matches(
         - If both allowed_queue_ids and allowed_game_modes are given, a match must satisfy both.
     """
     out: list[dict[str, Any]] = []
-    q_set = set(allowed_queue_ids) if allowed_queue_ids else None
-    gm_set = set(allowed_game_modes) if allowed_game_modes else None
+    q_set = _as_filter_set(allowed_queue_ids)
+    gm_set = _as_filter_set(allowed_game_modes)
     for m in matches:
         info = m.get("info") or {}
         if not info:
@@ -82,6 +365,52 @@ def filter_matches(
     return out
 
 
+_PEEK_SIZE = 4096
+_GAME_MODE_RE = re.compile(rb'"gameMode"\s*:\s*"([^"]*)"')
+_QUEUE_ID_RE = re.compile(rb'"queueId"\s*:\s*(-?\d+)')
+
+
+def match_file_excluded(
+    path: str,
+    *,
+    include_aram: bool = False,
+    allowed_queue_ids: Optional[Iterable[int]] = None,
+    allowed_game_modes: Iterable[str] | None = None,
+) -> bool:
+    """Return True if the start of match file ``path`` shows ``filter_matches`` would drop it.
+
+    Only the first few KB are read (decompressed for ``.gz``) and searched for
+    ``"gameMode"`` / ``"queueId"``, so rejected files can be skipped without a
+    full parse. ``gameMode`` sits near the top of Riot payloads; ``queueId``
+    follows ``participants`` and is usually out of reach. A field that is not
+    found, or an unreadable file, never excludes: the caller parses it and
+    ``filter_matches`` decides. Takes the same filters as ``filter_matches``.
+    """
+    q_set = _as_filter_set(allowed_queue_ids)
+    gm_set = _as_filter_set(allowed_game_modes)
+    if include_aram and q_set is None and gm_set is None:
+        return False
+    opener = gzip.open if path.endswith(".gz") else open
+    try:
+        with opener(path, "rb") as f:
+            head = f.read(_PEEK_SIZE)
+    except (OSError, EOFError):
+        return False
+
+    mode_match = _GAME_MODE_RE.search(head)
+    if mode_match is not None:
+        game_mode = mode_match.group(1).decode("utf-8", "replace")
+        if not include_aram and game_mode == "ARAM":
+            return True
+        if gm_set is not None and game_mode not in gm_set:
+            return True
+    if q_set is not None:
+        queue_match = _QUEUE_ID_RE.search(head)
+        if queue_match is not None and int(queue_match.group(1)) not in q_set:
+            return True
+    return False
+
+
 def save_figure(
     fig: Figure,
     filename: str,
@@ -15,10 +15,10 @@ import matplotlib.pyplot as plt
 from matplotlib.ticker import FuncFormatter
 import numpy as np
 from dotenv import load_dotenv
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from stats_visualization import league, analyze
 from stats_visualization.viz_types import EconomyData
-from stats_visualization.utils import filter_matches, save_figure, sanitize_player
+from stats_visualization.utils import filter_matches, find_participant, save_figure, sanitize_player
 
 sys.path.append(str(Path(__file__).parent.parent.parent))  # noqa: E402
 load_dotenv(dotenv_path="config.env")
@@ -30,6 +30,8 @@ def extract_economy_data(
     include_aram: bool = False,
     queue_filter: Optional[List[int]] = None,
     game_mode_whitelist: Optional[List[str]] = None,
+    *,
+    matches: Optional[List[Dict[str, Any]]] = None,
 ) -> EconomyData:
     """
     Extract economy and farming data for a specific player.
@@ -37,17 +39,19 @@ def extract_economy_data(
     Args:
         player_puuid (str): PUUID of the player
         matches_dir (str): Directory containing match JSON files
+        matches (list, optional): Already loaded and filtered matches; when
+            given, ``matches_dir`` and the filter arguments are ignored
 
     Returns:
         Dict containing economy statistics
     """
-    raw_matches = analyze.load_match_files(matches_dir)
-    matches = filter_matches(
-        raw_matches,
-        include_aram=include_aram,
-        allowed_queue_ids=queue_filter,
-        allowed_game_modes=game_mode_whitelist,
-    )
+    if matches is None:
+        matches = filter_matches(
+            analyze.load_match_files(matches_dir),
+            include_aram=include_aram,
+            allowed_queue_ids=queue_filter,
+            allowed_game_modes=game_mode_whitelist,
+        )
     economy_data: EconomyData = {
         "cs_per_min": [],
         "gold_per_min": [],
@@ -69,11 +73,7 @@ def extract_economy_data(
             continue
 
         # Find player data in this match
-        player_data = None
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_data = participant
-                break
+        player_data = find_participant(match, player_puuid)
 
         if not player_data:
             continue
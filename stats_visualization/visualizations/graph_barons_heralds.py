@@ -11,11 +11,11 @@ import argparse
 from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from dotenv import load_dotenv
 from stats_visualization import league, analyze
 from stats_visualization.viz_types import BaronHeraldData
-from stats_visualization.utils import filter_matches, save_figure, sanitize_player
+from stats_visualization.utils import filter_matches, find_participant, save_figure, sanitize_player
 
 sys.path.append(str(Path(__file__).parent.parent.parent))  # noqa: E402
 load_dotenv(dotenv_path="config.env")
@@ -27,6 +27,8 @@ def extract_baron_herald_data(
     include_aram: bool = False,
     queue_filter: Optional[List[int]] = None,
     game_mode_whitelist: Optional[List[str]] = None,
+    *,
+    matches: Optional[List[Dict[str, Any]]] = None,
 ) -> BaronHeraldData:
     """
     Extract baron and herald data for a specific player from match history.
@@ -34,17 +36,19 @@ def extract_baron_herald_data(
     Args:
         player_puuid (str): PUUID of the player
         matches_dir (str): Directory containing match JSON files
+        matches (list, optional): Already loaded and filtered matches; when
+            given, ``matches_dir`` and the filter arguments are ignored
 
     Returns:
         Dict containing baron and herald statistics
     """
-    raw_matches = analyze.load_match_files(matches_dir)
-    matches = filter_matches(
-        raw_matches,
-        include_aram=include_aram,
-        allowed_queue_ids=queue_filter,
-        allowed_game_modes=game_mode_whitelist,
-    )
+    if matches is None:
+        matches = filter_matches(
+            analyze.load_match_files(matches_dir),
+            include_aram=include_aram,
+            allowed_queue_ids=queue_filter,
+            allowed_game_modes=game_mode_whitelist,
+        )
     objective_data: BaronHeraldData = {
         "player_team_barons": [],
         "enemy_team_barons": [],
@@ -56,7 +60,8 @@ def extract_baron_herald_data(
     }
 
     for match in matches:
-        if "info" not in match or "participants" not in match["info"]:
+        info = match.get("info")
+        if not info or "participants" not in info:
             continue
 
         # Skip ARAM matches unless explicitly requested. ARAM map lacks baron/herald.
@@ -66,28 +71,27 @@ def extract_baron_herald_data(
         player_team_id = None
         player_won = False
 
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_team_id = participant.get("teamId")
-                player_won = participant.get("win", False)
-                break
+        participant = find_participant(match, player_puuid)
+        if participant is not None:
+            player_team_id = participant.get("teamId")
+            player_won = participant.get("win", False)
 
         if player_team_id is None:
             continue
 
         objective_data["total_games"] += 1
-        game_duration = match["info"].get("gameDuration", 0)
+        game_duration = info.get("gameDuration", 0)
         objective_data["game_durations"].append(game_duration / 60)  # Convert to minutes
         objective_data["wins"].append(player_won)
 
         # Extract team objective counts
-        if "teams" in match["info"]:
+        if "teams" in info:
             player_barons = 0
             enemy_barons = 0
             player_heralds = 0
             enemy_heralds = 0
 
-            for team in match["info"]["teams"]:
+            for team in info["teams"]:
                 objectives = team.get("objectives", {})
                 baron_kills = objectives.get("baron", {}).get("kills", 0)
                 herald_kills = objectives.get("riftHerald", {}).get("kills", 0)
@@ -117,11 +121,18 @@ def plot_baron_herald_analysis(player_name: str, objective_data: BaronHeraldData
 
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
 
+    # Per-game counts as arrays so all aggregation below stays vectorized
+    player_barons = np.asarray(objective_data["player_team_barons"], dtype=np.int32)
+    enemy_barons = np.asarray(objective_data["enemy_team_barons"], dtype=np.int32)
+    player_heralds = np.asarray(objective_data["player_team_heralds"], dtype=np.int32)
+    enemy_heralds = np.asarray(objective_data["enemy_team_heralds"], dtype=np.int32)
+    wins = np.asarray(objective_data["wins"], dtype=bool)
+
     # Average objectives comparison
-    avg_player_barons = np.mean(objective_data["player_team_barons"])
-    avg_enemy_barons = np.mean(objective_data["enemy_team_barons"])
-    avg_player_heralds = np.mean(objective_data["player_team_heralds"])
-    avg_enemy_heralds = np.mean(objective_data["enemy_team_heralds"])
+    avg_player_barons = player_barons.mean()
+    avg_enemy_barons = enemy_barons.mean()
+    avg_player_heralds = player_heralds.mean()
+    avg_enemy_heralds = enemy_heralds.mean()
 
     objectives = ["Barons", "Heralds"]
     player_avg = [avg_player_barons, avg_player_heralds]
@@ -154,22 +165,11 @@ def plot_baron_herald_analysis(player_name: str, objective_data: BaronHeraldData
     ax1.legend()
 
     # Add value labels
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + 0.01,
-                f"{height:.2f}",
-                ha="center",
-                va="bottom",
-            )
+    for bars in (bars1, bars2):
+        ax1.bar_label(bars, fmt="%.2f", padding=2)
 
     # Baron control distribution
-    baron_diff = [
-        p - e
-        for p, e in zip(objective_data["player_team_barons"], objective_data["enemy_team_barons"])
-    ]
+    baron_diff = player_barons - enemy_barons
     ax2.hist(baron_diff, bins=range(-4, 5), alpha=0.7, color="purple", edgecolor="black")
     ax2.axvline(0, color="red", linestyle="--", label="Even Baron Control")
     ax2.set_xlabel("Baron Advantage (Player Team - Enemy Team)")
@@ -179,10 +179,7 @@ def plot_baron_herald_analysis(player_name: str, objective_data: BaronHeraldData
     ax2.grid(True, alpha=0.3)
 
     # Herald control distribution
-    herald_diff = [
-        p - e
-        for p, e in zip(objective_data["player_team_heralds"], objective_data["enemy_team_heralds"])
-    ]
+    herald_diff = player_heralds - enemy_heralds
     ax3.hist(herald_diff, bins=range(-3, 4), alpha=0.7, color="orange", edgecolor="black")
     ax3.axvline(0, color="red", linestyle="--", label="Even Herald Control")
     ax3.set_xlabel("Herald Advantage (Player Team - Enemy Team)")
@@ -192,33 +189,28 @@ def plot_baron_herald_analysis(player_name: str, objective_data: BaronHeraldData
     ax3.grid(True, alpha=0.3)
 
     # Win rate correlation with major objectives
-    # Calculate total major objectives (barons + heralds)
-    player_total_obj = [
-        b + h
-        for b, h in zip(objective_data["player_team_barons"], objective_data["player_team_heralds"])
-    ]
-    enemy_total_obj = [
-        b + h
-        for b, h in zip(objective_data["enemy_team_barons"], objective_data["enemy_team_heralds"])
-    ]
-
-    win_rates: dict[str, list[bool]] = {"Behind": [], "Even": [], "Ahead": []}
-    for p_obj, e_obj, win in zip(player_total_obj, enemy_total_obj, objective_data["wins"]):
-        if p_obj < e_obj:
-            win_rates["Behind"].append(win)
-        elif p_obj == e_obj:
-            win_rates["Even"].append(win)
-        else:
-            win_rates["Ahead"].append(win)
+    # Sign of (player - enemy) total major objectives (barons + heralds) buckets each game.
+    # Only games with team objective data are comparable, matching the zipped lengths.
+    n_obj_games = min(player_barons.size, wins.size)
+    obj_sign = np.sign(
+        (player_barons + player_heralds)[:n_obj_games]
+        - (enemy_barons + enemy_heralds)[:n_obj_games]
+    )
+    obj_wins = wins[:n_obj_games]
+    win_rates: dict[str, np.ndarray] = {
+        "Behind": obj_wins[obj_sign < 0],
+        "Even": obj_wins[obj_sign == 0],
+        "Ahead": obj_wins[obj_sign > 0],
+    }
 
     categories: list[str] = []
     wr_values: list[float] = []
     colors: list[str] = []
 
-    for category, wins in win_rates.items():
-        if wins:
-            categories.append(f"{category}\n({len(wins)} games)")
-            wr_values.append(sum(wins) / len(wins) * 100)
+    for category, bucket_wins in win_rates.items():
+        if bucket_wins.size:
+            categories.append(f"{category}\n({bucket_wins.size} games)")
+            wr_values.append(float(bucket_wins.mean()) * 100)
             if category == "Behind":
                 colors.append("red")
             elif category == "Even":
@@ -233,15 +225,7 @@ def plot_baron_herald_analysis(player_name: str, objective_data: BaronHeraldData
         ax4.set_ylim(0, 100)
 
         # Add percentage labels
-        for bar, wr in zip(bars4, wr_values):
-            height = bar.get_height()
-            ax4.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + 1,
-                f"{wr:.1f}%",
-                ha="center",
-                va="bottom",
-            )
+        ax4.bar_label(bars4, labels=[f"{wr:.1f}%" for wr in wr_values], padding=2)
 
     plt.tight_layout()
     save_figure(
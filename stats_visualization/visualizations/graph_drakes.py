@@ -14,11 +14,11 @@ import argparse
 from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Optional, List, TypedDict, cast
+from typing import Any, Dict, Optional, List, TypedDict, cast
 from dotenv import load_dotenv
 from stats_visualization import league, analyze
 from stats_visualization.viz_types import DrakeData
-from stats_visualization.utils import filter_matches, save_figure, sanitize_player
+from stats_visualization.utils import filter_matches, find_participant, save_figure, sanitize_player
 
 sys.path.append(str(Path(__file__).parent.parent.parent))  # noqa: E402
 load_dotenv(dotenv_path="config.env")
@@ -49,15 +49,17 @@ def extract_drake_data(
     include_aram: bool = False,
     queue_filter: Optional[List[int]] = None,
     game_mode_whitelist: Optional[List[str]] = None,
+    *,
+    matches: Optional[List[Dict[str, Any]]] = None,
 ) -> DrakeData:
     """Extract drake-related data for a specific player from match history."""
-    raw_matches = analyze.load_match_files(matches_dir)
-    matches = filter_matches(
-        raw_matches,
-        include_aram=include_aram,
-        allowed_queue_ids=queue_filter,
-        allowed_game_modes=game_mode_whitelist,
-    )
+    if matches is None:
+        matches = filter_matches(
+            analyze.load_match_files(matches_dir),
+            include_aram=include_aram,
+            allowed_queue_ids=queue_filter,
+            allowed_game_modes=game_mode_whitelist,
+        )
     drake_data: DrakeData = {
         "player_team_drakes": [],
         "enemy_team_drakes": [],
@@ -73,18 +75,15 @@ def extract_drake_data(
         participants_raw = info_raw.get("participants")
         if not isinstance(participants_raw, list):
             continue
-        participants: List[_Participant] = [
-            cast(_Participant, p) for p in participants_raw if isinstance(p, dict)
-        ]
         player_team_id: Optional[int] = None
         player_won = False
-        for part in participants:
-            if part.get("puuid") == player_puuid:
-                tid_val = part.get("teamId")
-                if isinstance(tid_val, int):
-                    player_team_id = tid_val
-                player_won = bool(part.get("win", False))
-                break
+        found = find_participant(match, player_puuid)
+        if found is not None:
+            part = cast(_Participant, found)
+            tid_val = part.get("teamId")
+            if isinstance(tid_val, int):
+                player_team_id = tid_val
+            player_won = bool(part.get("win", False))
         if player_team_id is None:
             continue
         drake_data["total_games"] += 1
@@ -96,10 +95,12 @@ def extract_drake_data(
         drake_data["wins"].append(player_won)
         teams_raw = info_raw.get("teams")
         if isinstance(teams_raw, list):
-            teams: List[_Team] = [cast(_Team, t) for t in teams_raw if isinstance(t, dict)]
             player_drakes = 0
             enemy_drakes = 0
-            for team in teams:
+            for t in teams_raw:
+                if not isinstance(t, dict):
+                    continue
+                team = cast(_Team, t)
                 obj = team.get("objectives", {})
                 if isinstance(obj, dict):
                     dragon = obj.get("dragon", {})
@@ -126,9 +127,14 @@ def plot_drake_analysis(player_name: str, drake_data: DrakeData) -> None:
 
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
 
+    # Per-game counts as arrays so all aggregation below stays vectorized
+    player_drakes = np.asarray(drake_data["player_team_drakes"], dtype=np.int32)
+    enemy_drakes = np.asarray(drake_data["enemy_team_drakes"], dtype=np.int32)
+    wins = np.asarray(drake_data["wins"], dtype=bool)
+
     # Drake control comparison
-    avg_player_drakes = np.mean(drake_data["player_team_drakes"])
-    avg_enemy_drakes = np.mean(drake_data["enemy_team_drakes"])
+    avg_player_drakes = player_drakes.mean()
+    avg_enemy_drakes = enemy_drakes.mean()
 
     teams = ["Player Team", "Enemy Team"]
     avg_drakes = [avg_player_drakes, avg_enemy_drakes]
@@ -139,20 +145,10 @@ def plot_drake_analysis(player_name: str, drake_data: DrakeData) -> None:
     ax1.set_title(f"{player_name} - Dragon Control Comparison")
 
     # Add value labels
-    for bar, value in zip(bars1, avg_drakes):
-        height = bar.get_height()
-        ax1.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height + 0.05,
-            f"{value:.1f}",
-            ha="center",
-            va="bottom",
-        )
+    ax1.bar_label(bars1, fmt="%.1f", padding=2)
 
     # Drake control distribution
-    drake_diff = [
-        p - e for p, e in zip(drake_data["player_team_drakes"], drake_data["enemy_team_drakes"])
-    ]
+    drake_diff = player_drakes - enemy_drakes
     ax2.hist(drake_diff, bins=range(-6, 7), alpha=0.7, color="purple", edgecolor="black")
     ax2.axvline(0, color="red", linestyle="--", label="Even Drake Control")
     ax2.set_xlabel("Drake Advantage (Player Team - Enemy Team)")
@@ -162,27 +158,24 @@ def plot_drake_analysis(player_name: str, drake_data: DrakeData) -> None:
     ax2.grid(True, alpha=0.3)
 
     # Win rate by drake control
-    win_rates: dict[str, list[bool]] = {"Behind": [], "Even": [], "Ahead": []}
-    for p_drakes, e_drakes, win in zip(
-        drake_data["player_team_drakes"],
-        drake_data["enemy_team_drakes"],
-        drake_data["wins"],
-    ):
-        if p_drakes < e_drakes:
-            win_rates["Behind"].append(win)
-        elif p_drakes == e_drakes:
-            win_rates["Even"].append(win)
-        else:
-            win_rates["Ahead"].append(win)
+    # Only games with team objective data are comparable, matching the zipped lengths.
+    n_obj_games = min(drake_diff.size, wins.size)
+    drake_sign = np.sign(drake_diff[:n_obj_games])
+    obj_wins = wins[:n_obj_games]
+    win_rates: dict[str, np.ndarray] = {
+        "Behind": obj_wins[drake_sign < 0],
+        "Even": obj_wins[drake_sign == 0],
+        "Ahead": obj_wins[drake_sign > 0],
+    }
 
     categories: list[str] = []
     wr_values: list[float] = []
     colors: list[str] = []
 
-    for category, wins in win_rates.items():
-        if wins:
-            categories.append(f"{category}\n({len(wins)} games)")
-            wr_values.append(sum(wins) / len(wins) * 100)
+    for category, bucket_wins in win_rates.items():
+        if bucket_wins.size:
+            categories.append(f"{category}\n({bucket_wins.size} games)")
+            wr_values.append(float(bucket_wins.mean()) * 100)
             if category == "Behind":
                 colors.append("red")
             elif category == "Even":
@@ -197,21 +190,13 @@ def plot_drake_analysis(player_name: str, drake_data: DrakeData) -> None:
         ax3.set_ylim(0, 100)
 
         # Add percentage labels
-        for bar, wr in zip(bars3, wr_values):
-            height = bar.get_height()
-            ax3.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + 1,
-                f"{wr:.1f}%",
-                ha="center",
-                va="bottom",
-            )
+        ax3.bar_label(bars3, labels=[f"{wr:.1f}%" for wr in wr_values], padding=2)
 
     # Drake control over time
-    game_numbers = range(1, len(drake_data["player_team_drakes"]) + 1)
+    game_numbers = np.arange(1, player_drakes.size + 1)
     ax4.plot(
         game_numbers,
-        drake_data["player_team_drakes"],
+        player_drakes,
         "o-",
         label="Player Team",
         color="blue",
@@ -219,7 +204,7 @@ def plot_drake_analysis(player_name: str, drake_data: DrakeData) -> None:
     )
     ax4.plot(
         game_numbers,
-        drake_data["enemy_team_drakes"],
+        enemy_drakes,
         "s-",
         label="Enemy Team",
         color="red",
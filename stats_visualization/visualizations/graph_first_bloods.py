@@ -11,30 +11,40 @@ import os
 import sys
 import argparse
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 import matplotlib.pyplot as plt
 import numpy as np
 from dotenv import load_dotenv
 from stats_visualization import league
 from stats_visualization import analyze
 from stats_visualization.viz_types import EarlyGameData
+from stats_visualization.utils import find_participant
 from collections import defaultdict
 
 sys.path.append(str(Path(__file__).parent.parent.parent))  # noqa: E402
 load_dotenv(dotenv_path="config.env")
 
 
-def extract_early_game_data(player_puuid: str, matches_dir: str = "matches") -> EarlyGameData:
+def extract_early_game_data(
+    player_puuid: str,
+    matches_dir: str = "matches",
+    *,
+    matches: Optional[List[Dict[str, Any]]] = None,
+) -> EarlyGameData:
     """
     Extract early game and first blood data for a specific player from match history.
 
     Args:
         player_puuid (str): PUUID of the player
         matches_dir (str): Directory containing match JSON files
+        matches (list, optional): Already loaded matches; when given,
+            ``matches_dir`` is ignored
 
     Returns:
         Dict containing early game statistics
     """
-    matches = analyze.load_match_files(matches_dir)
+    if matches is None:
+        matches = analyze.load_match_files(matches_dir)
     early_game_data: EarlyGameData = {
         "first_blood_kills": 0,
         "first_blood_deaths": 0,
@@ -49,46 +59,56 @@ def extract_early_game_data(player_puuid: str, matches_dir: str = "matches") ->
         "total_games": 0,
     }
 
+    # Counters live in locals and list appends are bound once, so the loop body
+    # avoids a dict lookup + store per field; results are written back at the end.
+    total_games = first_blood_kills = first_blood_assists = first_blood_deaths = 0
+    first_tower_kills = 0
+    add_kills = early_game_data["early_kills"].append
+    add_deaths = early_game_data["early_deaths"].append
+    add_cs = early_game_data["early_cs"].append
+    add_win = early_game_data["wins"].append
+    add_champion = early_game_data["champions"].append
+    add_role = early_game_data["roles"].append
+
     for match in matches:
         if "info" not in match or "participants" not in match["info"]:
             continue
 
         # Find player data in this match
-        player_data = None
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_data = participant
-                break
+        player_data = find_participant(match, player_puuid)
 
         if not player_data:
             continue
 
-        early_game_data["total_games"] += 1
+        get = player_data.get
+        total_games += 1
 
         # First blood statistics
-        if player_data.get("firstBloodKill", False):
-            early_game_data["first_blood_kills"] += 1
-        if player_data.get("firstBloodAssist", False):
-            early_game_data["first_blood_assists"] += 1
-        if player_data.get("firstBloodVictim", False):
-            early_game_data["first_blood_deaths"] += 1
+        if get("firstBloodKill", False):
+            first_blood_kills += 1
+        if get("firstBloodAssist", False):
+            first_blood_assists += 1
+        if get("firstBloodVictim", False):
+            first_blood_deaths += 1
 
         # First tower
-        if player_data.get("firstTowerKill", False):
-            early_game_data["first_tower_kills"] += 1
+        if get("firstTowerKill", False):
+            first_tower_kills += 1
 
         # Early game performance (first 15 minutes approximation)
         # Using available stats as proxies for early game performance
-        kills = player_data.get("kills", 0)
-        deaths = player_data.get("deaths", 0)
-        cs = player_data.get("totalMinionsKilled", 0) + player_data.get("neutralMinionsKilled", 0)
-
-        early_game_data["early_kills"].append(kills)
-        early_game_data["early_deaths"].append(deaths)
-        early_game_data["early_cs"].append(cs)
-        early_game_data["wins"].append(player_data.get("win", False))
-        early_game_data["champions"].append(player_data.get("championName", "Unknown"))
-        early_game_data["roles"].append(player_data.get("teamPosition", "Unknown"))
+        add_kills(get("kills", 0))
+        add_deaths(get("deaths", 0))
+        add_cs(get("totalMinionsKilled", 0) + get("neutralMinionsKilled", 0))
+        add_win(get("win", False))
+        add_champion(get("championName", "Unknown"))
+        add_role(get("teamPosition", "Unknown"))
+
+    early_game_data["total_games"] = total_games
+    early_game_data["first_blood_kills"] = first_blood_kills
+    early_game_data["first_blood_assists"] = first_blood_assists
+    early_game_data["first_blood_deaths"] = first_blood_deaths
+    early_game_data["first_tower_kills"] = first_tower_kills
 
     return early_game_data
 
@@ -125,16 +145,16 @@ def plot_first_blood_analysis(player_name: str, early_game_data: EarlyGameData)
     ax1.set_ylim(0, max(fb_percentages) * 1.2 if fb_percentages else 10)
 
     # Add percentage and count labels
-    for bar, percentage, count in zip(bars1, fb_percentages, fb_counts):
-        height = bar.get_height()
-        ax1.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height + 0.5,
-            f'{percentage:.1f}%\n({count}/{early_game_data["total_games"]})',
-            ha="center",
-            va="bottom",
-            fontsize=9,
-        )
+    total_games = early_game_data["total_games"]
+    ax1.bar_label(
+        bars1,
+        labels=[
+            f"{percentage:.1f}%\n({count}/{total_games})"
+            for percentage, count in zip(fb_percentages, fb_counts)
+        ],
+        padding=2,
+        fontsize=9,
+    )
 
     ax1.tick_params(axis="x", rotation=45)
 
@@ -212,15 +232,7 @@ def plot_first_blood_analysis(player_name: str, early_game_data: EarlyGameData)
         ax4.set_ylim(0, 100)
 
         # Add percentage labels
-        for bar, wr in zip(bars4, win_rates):
-            height = bar.get_height()
-            ax4.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + 1,
-                f"{wr:.1f}%",
-                ha="center",
-                va="bottom",
-            )
+        ax4.bar_label(bars4, labels=[f"{wr:.1f}%" for wr in win_rates], padding=2)
 
     plt.tight_layout()
     from stats_visualization.utils import save_figure, sanitize_player
@@ -273,32 +285,28 @@ def plot_role_early_game_comparison(player_name: str, early_game_data: EarlyGame
     ax1.set_ylabel("Average Kills per Game")
     ax1.set_title(f"{player_name} - Average Kills by Role")
 
-    for bar, kills, role in zip(bars1, avg_kills, role_names):
-        height = bar.get_height()
-        games = filtered_roles[role]["games"]
-        ax1.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height + 0.05,
-            f"{kills:.1f}\n({games}g)",
-            ha="center",
-            va="bottom",
-        )
+    ax1.bar_label(
+        bars1,
+        labels=[
+            f"{kills:.1f}\n({filtered_roles[role]['games']}g)"
+            for kills, role in zip(avg_kills, role_names)
+        ],
+        padding=2,
+    )
 
     # Average deaths by role
     bars2 = ax2.bar(role_names, avg_deaths, color="lightcoral", alpha=0.7)
     ax2.set_ylabel("Average Deaths per Game")
     ax2.set_title(f"{player_name} - Average Deaths by Role")
 
-    for bar, deaths, role in zip(bars2, avg_deaths, role_names):
-        height = bar.get_height()
-        games = filtered_roles[role]["games"]
-        ax2.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height + 0.05,
-            f"{deaths:.1f}\n({games}g)",
-            ha="center",
-            va="bottom",
-        )
+    ax2.bar_label(
+        bars2,
+        labels=[
+            f"{deaths:.1f}\n({filtered_roles[role]['games']}g)"
+            for deaths, role in zip(avg_deaths, role_names)
+        ],
+        padding=2,
+    )
 
     plt.tight_layout()
     from stats_visualization.utils import save_figure, sanitize_player
@@ -15,13 +15,12 @@ import argparse
 from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Dict, Optional, List, cast, Type, TypedDict
+from typing import Any, Dict, Optional, List, cast, Type, TypedDict
 import datetime
 import warnings
-from collections import defaultdict
 from stats_visualization import league
 from stats_visualization import analyze
-from stats_visualization.viz_types import KillsData, ChampionStats
+from stats_visualization.viz_types import KillsData
 from stats_visualization.utils import filter_matches, save_figure, sanitize_player
 
 sys.path.append(str(Path(__file__).parent.parent.parent))  # noqa: E402
@@ -52,15 +51,17 @@ def extract_kills_data(
     include_aram: bool = False,
     queue_filter: Optional[List[int]] = None,
     game_mode_whitelist: Optional[List[str]] = None,
+    *,
+    matches: Optional[List[Dict[str, Any]]] = None,
 ) -> KillsData:
     """Extract kills-related data for a specific player from match history."""
-    raw_matches = analyze.load_match_files(matches_dir)
-    matches = filter_matches(
-        raw_matches,
-        include_aram=include_aram,
-        allowed_queue_ids=queue_filter,
-        allowed_game_modes=game_mode_whitelist,
-    )
+    if matches is None:
+        matches = filter_matches(
+            analyze.load_match_files(matches_dir),
+            include_aram=include_aram,
+            allowed_queue_ids=queue_filter,
+            allowed_game_modes=game_mode_whitelist,
+        )
     kills_data: KillsData = {
         "kills": [],
         "deaths": [],
@@ -74,6 +75,22 @@ def extract_kills_data(
         "total_games": 0,
     }
 
+    # Resolved once: a single fallback date for matches lacking gameCreation
+    # (the value is not plotted), a local alias for the per-match conversion and
+    # bound list appends so the loop body uses fast locals, not dict + attr lookups.
+    fallback_date = datetime.datetime.now()
+    fromtimestamp = datetime.datetime.fromtimestamp
+    add_date = kills_data["game_dates"].append
+    add_duration = kills_data["game_durations"].append
+    add_kills = kills_data["kills"].append
+    add_deaths = kills_data["deaths"].append
+    add_assists = kills_data["assists"].append
+    add_kda = kills_data["kda_ratios"].append
+    add_kp = kills_data["kill_participation"].append
+    add_champion = kills_data["champions"].append
+    add_win = kills_data["wins"].append
+    total_games = 0
+
     for match in matches:
         info_raw: object = match.get("info")
         if not isinstance(info_raw, dict):
@@ -81,45 +98,46 @@ def extract_kills_data(
         participants_raw = info_raw.get("participants")
         if not isinstance(participants_raw, list):
             continue
-        participants: List[_Participant] = [
-            cast(_Participant, p) for p in participants_raw if isinstance(p, dict)
-        ]
+        # Single pass: locate the player and total kills per team without
+        # materializing an intermediate participant list for every match.
         player: Optional[_Participant] = None
-        for part in participants:
-            if part.get("puuid") == player_puuid:
+        team_kills_by_id: Dict[Optional[int], int] = {}
+        for p in participants_raw:
+            if not isinstance(p, dict):
+                continue
+            part = cast(_Participant, p)
+            tid = part.get("teamId")
+            team_kills_by_id[tid] = team_kills_by_id.get(tid, 0) + int(part.get("kills", 0))
+            if player is None and part.get("puuid") == player_puuid:
                 player = part
-                break
         if player is None:
             continue
-        kills_data["total_games"] += 1
+        total_games += 1
         gc_val = info_raw.get("gameCreation", 0)
         if isinstance(gc_val, (int, float)) and gc_val > 0:
-            kills_data["game_dates"].append(datetime.datetime.fromtimestamp(float(gc_val) / 1000))
+            add_date(fromtimestamp(gc_val / 1000))
         else:
-            kills_data["game_dates"].append(datetime.datetime.now())
+            add_date(fallback_date)
         gd_val = info_raw.get("gameDuration", 0)
         if isinstance(gd_val, (int, float)):
-            kills_data["game_durations"].append(float(gd_val) / 60.0)
+            add_duration(float(gd_val) / 60.0)
         else:
-            kills_data["game_durations"].append(0.0)
+            add_duration(0.0)
         kills = int(player.get("kills", 0))
         deaths = int(player.get("deaths", 0))
         assists = int(player.get("assists", 0))
-        kills_data["kills"].append(kills)
-        kills_data["deaths"].append(deaths)
-        kills_data["assists"].append(assists)
+        add_kills(kills)
+        add_deaths(deaths)
+        add_assists(assists)
         kda = (kills + assists) / max(deaths, 1)
-        kills_data["kda_ratios"].append(float(kda))
-        team_kills = 0
-        player_team_id = player.get("teamId")
-        for part in participants:
-            if part.get("teamId") == player_team_id:
-                team_kills += int(part.get("kills", 0))
+        add_kda(float(kda))
+        team_kills = team_kills_by_id.get(player.get("teamId"), 0)
         kp = (kills + assists) / max(team_kills, 1) * 100
-        kills_data["kill_participation"].append(kp)
-        kills_data["champions"].append(str(player.get("championName", "Unknown")))
-        kills_data["wins"].append(bool(player.get("win", False)))
+        add_kp(kp)
+        add_champion(str(player.get("championName", "Unknown")))
+        add_win(bool(player.get("win", False)))
 
+    kills_data["total_games"] = total_games
     return kills_data
 
 
@@ -136,12 +154,16 @@ def plot_kills_analysis(player_name: str, kills_data: KillsData) -> None:
 
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
 
+    kills = np.asarray(kills_data["kills"], dtype=float)
+    assists = np.asarray(kills_data["assists"], dtype=float)
+    wins = np.asarray(kills_data["wins"], dtype=bool)
+
     # Kills progression over time
-    game_numbers = range(1, len(kills_data["kills"]) + 1)
-    ax1.plot(game_numbers, kills_data["kills"], "o-", alpha=0.7, color="red", label="Kills")
+    game_numbers = np.arange(1, kills.size + 1)
+    ax1.plot(game_numbers, kills, "o-", alpha=0.7, color="red", label="Kills")
     ax1.plot(
         game_numbers,
-        kills_data["assists"],
+        assists,
         "s-",
         alpha=0.7,
         color="blue",
@@ -149,9 +171,9 @@ def plot_kills_analysis(player_name: str, kills_data: KillsData) -> None:
     )
 
     # Add trend lines
-    if len(kills_data["kills"]) > 1:
-        kills_trend = np.polyfit(game_numbers, kills_data["kills"], 1)
-        assists_trend = np.polyfit(game_numbers, kills_data["assists"], 1)
+    if kills.size > 1:
+        kills_trend = np.polyfit(game_numbers, kills, 1)
+        assists_trend = np.polyfit(game_numbers, assists, 1)
 
         ax1.plot(
             game_numbers,
@@ -198,20 +220,19 @@ def plot_kills_analysis(player_name: str, kills_data: KillsData) -> None:
     ax3.set_ylim(0, 100)
 
     # Performance by game outcome
-    win_kills = [k for k, w in zip(kills_data["kills"], kills_data["wins"]) if w]
-    loss_kills = [k for k, w in zip(kills_data["kills"], kills_data["wins"]) if not w]
-    # Retained for potential future use (e.g., deeper outcome-based KDA comparison)
+    win_kills = kills[wins]
+    loss_kills = kills[~wins]
 
     # Box plot comparison
     data_to_plot = []
     labels = []
 
-    if win_kills:
+    if win_kills.size:
         data_to_plot.append(win_kills)
-        labels.append(f"Wins\n({len(win_kills)} games)")
-    if loss_kills:
+        labels.append(f"Wins\n({win_kills.size} games)")
+    if loss_kills.size:
         data_to_plot.append(loss_kills)
-        labels.append(f"Losses\n({len(loss_kills)} games)")
+        labels.append(f"Losses\n({loss_kills.size} games)")
 
     if data_to_plot:
         bp = ax4.boxplot(data_to_plot, labels=labels, patch_artist=True)
@@ -238,44 +259,31 @@ def plot_detailed_performance(player_name: str, kills_data: KillsData) -> None:
     if kills_data["total_games"] == 0:
         return
 
-    # Champion performance analysis
-    champion_stats: Dict[str, ChampionStats] = defaultdict(
-        lambda: {
-            "kills": [],
-            "deaths": [],
-            "assists": [],
-            "kda": [],
-            "games": 0,
-        }
+    # Champion performance analysis: group games by champion in one pass
+    kills = np.asarray(kills_data["kills"], dtype=float)
+    kdas = np.asarray(kills_data["kda_ratios"], dtype=float)
+    names, first_seen, group, games = np.unique(
+        np.asarray(kills_data["champions"]),
+        return_index=True,
+        return_inverse=True,
+        return_counts=True,
     )
+    kda_sums = np.bincount(group, weights=kdas, minlength=names.size)
 
-    for i, champion in enumerate(kills_data["champions"]):
-        champion_stats[champion]["kills"].append(kills_data["kills"][i])
-        champion_stats[champion]["deaths"].append(kills_data["deaths"][i])
-        champion_stats[champion]["assists"].append(kills_data["assists"][i])
-        champion_stats[champion]["kda"].append(kills_data["kda_ratios"][i])
-        champion_stats[champion]["games"] += 1
+    # Champions with at least 2 games, most played first (ties keep first-seen order)
+    order = np.lexsort((first_seen, -games))
+    top = order[games[order] >= 2][:6]
 
-    # Filter champions with at least 2 games
-    filtered_champions = {
-        champ: stats for champ, stats in champion_stats.items() if stats["games"] >= 2
-    }
-
-    if not filtered_champions:
-        print(f"No champions with enough games for detailed analysis: {len(filtered_champions)}")
+    if top.size == 0:
+        print(f"No champions with enough games for detailed analysis: {top.size}")
         return
 
-    # Get top 6 most played champions
-    top_champions = dict(
-        sorted(filtered_champions.items(), key=lambda x: x[1]["games"], reverse=True)[:6]
-    )
-
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
 
     # Average KDA by champion
-    champions = list(top_champions.keys())
-    avg_kdas = [np.mean(stats["kda"]) for stats in top_champions.values()]
-    games_count = [stats["games"] for stats in top_champions.values()]
+    champions = names[top].tolist()
+    avg_kdas = kda_sums[top] / games[top]
+    games_count = games[top].tolist()
 
     bars1 = ax1.bar(champions, avg_kdas, color="skyblue", alpha=0.7)
     ax1.set_ylabel("Average KDA")
@@ -283,19 +291,10 @@ def plot_detailed_performance(player_name: str, kills_data: KillsData) -> None:
     ax1.tick_params(axis="x", rotation=45)
 
     # Add game count labels
-    for bar, games in zip(bars1, games_count):
-        height = bar.get_height()
-        ax1.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height + 0.05,
-            f"{games} games",
-            ha="center",
-            va="bottom",
-            fontsize=9,
-        )
+    ax1.bar_label(bars1, labels=[f"{games} games" for games in games_count], padding=2, fontsize=9)
 
     # Kill distribution by champion (box plot)
-    champion_kills = [top_champions[champ]["kills"] for champ in champions]
+    champion_kills = [kills[group == idx] for idx in top]
     bp = ax2.boxplot(champion_kills, labels=champions, patch_artist=True)
 
     # Use a stable qualitative colormap available in all versions
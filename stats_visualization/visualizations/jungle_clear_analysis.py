@@ -19,18 +19,34 @@ from dotenv import load_dotenv
 from stats_visualization import league
 from stats_visualization import analyze
 from stats_visualization.viz_types import JungleData
-from stats_visualization.utils import filter_matches
+from stats_visualization.utils import filter_matches, find_participant
 
 sys.path.append(str(Path(__file__).parent.parent.parent))  # noqa: E402
 load_dotenv(dotenv_path="config.env")
 
 
+# Typical first clear time (minutes) per champion, built once at import so the
+# per-match estimate is a single dict lookup. Riot's ``championName`` drops
+# spaces ("LeeSin"), so both spellings are listed.
+_DEFAULT_BASE_CLEAR_TIME = 3.6
+_CHAMPION_BASE_CLEAR_TIMES: Dict[str, float] = {
+    **dict.fromkeys(["Graves", "Karthus", "Morgana", "Fiddlesticks", "Shyvana"], 3.2),
+    **dict.fromkeys(
+        ["Lee Sin", "LeeSin", "Elise", "Jarvan IV", "JarvanIV", "Xin Zhao", "XinZhao", "Warwick"],
+        3.5,
+    ),
+    **dict.fromkeys(["Rammus", "Sejuani", "Zac", "Amumu"], 4.0),
+}
+
+
 def extract_jungle_clear_data(
     player_puuid: str,
     matches_dir: str = "matches",
     include_aram: bool = False,
     queue_filter: Optional[List[int]] = None,
     game_mode_whitelist: Optional[List[str]] = None,
+    *,
+    matches: Optional[List[Dict[str, Any]]] = None,
 ) -> JungleData:
     """
     Extract jungle clear time data for a specific player.
@@ -38,17 +54,19 @@ def extract_jungle_clear_data(
     Args:
         player_puuid (str): PUUID of the player
         matches_dir (str): Directory containing match JSON files
+        matches (list, optional): Already loaded and filtered matches; when
+            given, ``matches_dir`` and the filter arguments are ignored
 
     Returns:
         Dict containing jungle clear statistics
     """
-    raw_matches = analyze.load_match_files(matches_dir)
-    matches = filter_matches(
-        raw_matches,
-        include_aram=include_aram,
-        allowed_queue_ids=queue_filter,
-        allowed_game_modes=game_mode_whitelist,
-    )
+    if matches is None:
+        matches = filter_matches(
+            analyze.load_match_files(matches_dir),
+            include_aram=include_aram,
+            allowed_queue_ids=queue_filter,
+            allowed_game_modes=game_mode_whitelist,
+        )
     jungle_data: JungleData = {
         "first_clear_times": [],
         "champions": [],
@@ -64,11 +82,7 @@ def extract_jungle_clear_data(
             continue
 
         # Find player data in this match
-        player_data = None
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_data = participant
-                break
+        player_data = find_participant(match, player_puuid)
 
         if not player_data:
             continue
@@ -192,18 +206,7 @@ def estimate_clear_time_from_stats(player_data: Dict[str, Any]) -> Optional[floa
         return None
 
     # Champion-based estimates (typical first clear times)
-    fast_clearers = ["Graves", "Karthus", "Morgana", "Fiddlesticks", "Shyvana"]
-    medium_clearers = ["Lee Sin", "Elise", "Jarvan IV", "Xin Zhao", "Warwick"]
-    slow_clearers = ["Rammus", "Sejuani", "Zac", "Amumu"]
-
-    if champion in fast_clearers:
-        base_time = 3.2  # minutes
-    elif champion in medium_clearers:
-        base_time = 3.5
-    elif champion in slow_clearers:
-        base_time = 4.0
-    else:
-        base_time = 3.6  # Default estimate
+    base_time = _CHAMPION_BASE_CLEAR_TIMES.get(champion, _DEFAULT_BASE_CLEAR_TIME)
 
     # Add some variance based on performance
     # Higher CS efficiency suggests faster clear
@@ -407,12 +410,12 @@ def plot_jungle_clear_analysis(player_name: str, jungle_data: Union[JungleData,
 
     # 4. Summary Statistics
     ax4.axis("off")
-    summary_text = f"""Jungle Performance Summary
+    summary_parts = [f"""Jungle Performance Summary
 
 Total Games Analyzed: {jungle_data['total_games']}
 Jungle Games: {jungle_data['jungle_games']}
 
-"""
+"""]
 
     if jungle_data["first_clear_times"]:
         clear_times = jungle_data["first_clear_times"]
@@ -420,23 +423,23 @@ Jungle Games: {jungle_data['jungle_games']}
         best_time = min(clear_times)
         worst_time = max(clear_times)
 
-        summary_text += f"""Clear Time Statistics:
+        summary_parts.append(f"""Clear Time Statistics:
 • Average: {avg_time:.2f} minutes
 • Best: {best_time:.2f} minutes
 • Worst: {worst_time:.2f} minutes
 • Games with data: {len(clear_times)}
 
-"""
+""")
 
     if jungle_data["wins"]:
         wins_list = jungle_data["wins"]
         win_rate = np.mean(wins_list) * 100
-        summary_text += f"Win Rate: {win_rate:.1f}% ({sum(wins_list)}/{len(wins_list)})"
+        summary_parts.append(f"Win Rate: {win_rate:.1f}% ({sum(wins_list)}/{len(wins_list)})")
 
     ax4.text(
         0.05,
         0.95,
-        summary_text,
+        "".join(summary_parts),
         transform=ax4.transAxes,
         fontsize=11,
         verticalalignment="top",
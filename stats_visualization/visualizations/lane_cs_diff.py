@@ -86,6 +86,9 @@ def _extract_snapshots_from_root_timeline(
     frames: List[Dict[str, Any]] = [
         cast(Dict[str, Any], f) for f in frames_raw if isinstance(f, dict)
     ]
+    # participantFrames keys are the participant ids as JSON strings; map the
+    # wanted ones back to ints once instead of int()-parsing every key per frame.
+    wanted_pids: Dict[str, int] = {str(pid): pid for pid in participant_ids}
     result: Dict[int, Dict[int, Dict[str, int]]] = {m: {} for m in SNAP_MINUTES}
     for minute in SNAP_MINUTES:
         target_ms = minute * 60_000
@@ -101,13 +104,8 @@ def _extract_snapshots_from_root_timeline(
             if not isinstance(p_frames, dict):
                 continue
             for pid_str, pf_raw in p_frames.items():
-                if not isinstance(pf_raw, dict):
-                    continue
-                try:
-                    pid = int(pid_str)
-                except (ValueError, TypeError):
-                    continue
-                if pid not in participant_ids:
+                pid = wanted_pids.get(pid_str)
+                if pid is None or not isinstance(pf_raw, dict):
                     continue
                 prev_delta = deltas.get(pid, 10**12)
                 if delta < prev_delta:
@@ -139,18 +137,21 @@ def extract_lane_cs_diff_data(
     include_aram: bool = False,
     queue_filter: Optional[List[int]] = None,
     game_mode_whitelist: Optional[List[str]] = None,
+    *,
+    matches: Optional[List[Dict[str, Any]]] = None,
 ) -> LaneCSDiffData:
     """Extract lane CS diff timeline data for player.
 
     Matches lacking opponent or required timeline data are counted as skipped.
+    Pass already filtered ``matches`` to skip loading from ``matches_dir``.
     """
-    raw_matches = analyze.load_match_files(matches_dir)
-    matches = filter_matches(
-        raw_matches,
-        include_aram=include_aram,
-        allowed_queue_ids=queue_filter,
-        allowed_game_modes=game_mode_whitelist,
-    )
+    if matches is None:
+        matches = filter_matches(
+            analyze.load_match_files(matches_dir),
+            include_aram=include_aram,
+            allowed_queue_ids=queue_filter,
+            allowed_game_modes=game_mode_whitelist,
+        )
     data: LaneCSDiffData = {
         "match_indices": [],
         "cs10": [],
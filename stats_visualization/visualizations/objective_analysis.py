@@ -9,12 +9,12 @@ import argparse
 from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Optional
+from typing import Any, Optional
 from dotenv import load_dotenv
 from stats_visualization import league
 from stats_visualization import analyze
 from stats_visualization.viz_types import ObjectiveData
-from stats_visualization.utils import filter_matches, save_figure, sanitize_player
+from stats_visualization.utils import filter_matches, find_participant, save_figure, sanitize_player
 
 sys.path.append(str(Path(__file__).parent.parent.parent))  # noqa: E402
 load_dotenv(dotenv_path="config.env")
@@ -26,6 +26,8 @@ def extract_objective_data(
     include_aram: bool = False,
     queue_filter: Optional[list[int]] = None,
     game_mode_whitelist: Optional[list[str]] = None,
+    *,
+    matches: Optional[list[dict[str, Any]]] = None,
 ) -> ObjectiveData:
     """
     Extract objective-related data for a specific player.
@@ -33,17 +35,19 @@ def extract_objective_data(
     Args:
         player_puuid (str): PUUID of the player
         matches_dir (str): Directory containing match JSON files
+        matches (list, optional): Already loaded and filtered matches; when
+            given, ``matches_dir`` and the filter arguments are ignored
 
     Returns:
         Dict containing objective statistics
     """
-    raw_matches = analyze.load_match_files(matches_dir)
-    matches = filter_matches(
-        raw_matches,
-        include_aram=include_aram,
-        allowed_queue_ids=queue_filter,
-        allowed_game_modes=game_mode_whitelist,
-    )
+    if matches is None:
+        matches = filter_matches(
+            analyze.load_match_files(matches_dir),
+            include_aram=include_aram,
+            allowed_queue_ids=queue_filter,
+            allowed_game_modes=game_mode_whitelist,
+        )
     objective_data: ObjectiveData = {
         "dragons": {"player_team": [], "enemy_team": [], "wins": [], "types": []},
         "barons": {"player_team": [], "enemy_team": [], "wins": [], "types": []},
@@ -71,11 +75,10 @@ def extract_objective_data(
         player_team_id = None
         player_won = False
 
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_team_id = participant.get("teamId")
-                player_won = participant.get("win", False)
-                break
+        participant = find_participant(match, player_puuid)
+        if participant is not None:
+            player_team_id = participant.get("teamId")
+            player_won = participant.get("win", False)
 
         if player_team_id is None:
             continue
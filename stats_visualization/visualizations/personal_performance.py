@@ -4,14 +4,15 @@ import os
 import sys
 import argparse
 import pathlib
-import requests
+from collections import defaultdict
+from operator import itemgetter
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import TypedDict, Optional, Any
+from typing import Any, NamedTuple, Optional, TypedDict
 from dotenv import load_dotenv
 from stats_visualization import league
 from stats_visualization import analyze
-from stats_visualization.utils import save_figure, sanitize_player, filter_matches
+from stats_visualization.utils import save_figure, sanitize_player, filter_matches, find_participant
 
 sys.path.append(str(pathlib.Path(__file__).parent.parent.parent))  # noqa: E402
 load_dotenv(dotenv_path="config.env")
@@ -22,6 +23,52 @@ class _TrendPoint(TypedDict):
     cumulative_win_rate: float  # percentage 0-100
 
 
+class PlayerGame(NamedTuple):
+    """The tracked player's fields from one match, extracted once per match."""
+
+    champion: str
+    role: str
+    win: bool
+    kills: int
+    deaths: int
+    assists: int
+    damage: int
+    gold: int
+
+
+# Riot participant keys (with defaults) in PlayerGame field order
+_PLAYER_GAME_FIELDS = (
+    ("championName", "Unknown"),
+    ("teamPosition", "Unknown"),
+    ("win", False),
+    ("kills", 0),
+    ("deaths", 0),
+    ("assists", 0),
+    ("totalDamageDealtToChampions", 0),
+    ("goldEarned", 0),
+)
+_get_player_game = itemgetter(*(name for name, _ in _PLAYER_GAME_FIELDS))
+
+
+def extract_player_games(matches: list[dict[str, Any]], player_puuid: str) -> list[PlayerGame]:
+    """Return one PlayerGame per match the player appears in, preserving order."""
+    games: list[PlayerGame] = []
+    for match in matches:
+        participant = find_participant(match, player_puuid)
+        if participant is None:
+            continue
+        try:
+            games.append(PlayerGame._make(_get_player_game(participant)))
+        except KeyError:
+            games.append(PlayerGame._make(participant.get(n, d) for n, d in _PLAYER_GAME_FIELDS))
+    return games
+
+
+def _empty_perf_stats() -> dict[str, float]:
+    """Zeroed per-champion / per-role accumulator."""
+    return {"games": 0, "wins": 0, "total_kda": 0, "total_damage": 0, "total_gold": 0}
+
+
 def plot_performance_trends(
     player_puuid: str,
     player_name: str,
@@ -30,6 +77,7 @@ def plot_performance_trends(
     include_aram: bool = False,
     queue_filter: Optional[list[int]] = None,
     game_mode_whitelist: Optional[list[str]] = None,
+    matches: Optional[list[dict[str, Any]]] = None,
 ):
     """Plot KDA and win rate trends over time for a player.
 
@@ -41,6 +89,7 @@ def plot_performance_trends(
         include_aram=include_aram,
         queue_filter=queue_filter,
         game_mode_whitelist=game_mode_whitelist,
+        matches=matches,
     )
     if not matches:
         print(f"No matches found for {player_name}")
@@ -54,22 +103,9 @@ def plot_performance_trends(
 
     trend_points: list[_TrendPoint] = []
     wins = 0
-    for idx, match in enumerate(matches):
-        participant = next(
-            (
-                p
-                for p in match.get("info", {}).get("participants", [])
-                if p.get("puuid") == player_puuid
-            ),
-            None,
-        )
-        if not participant:
-            continue
-        kills = participant.get("kills", 0)
-        deaths = participant.get("deaths", 0)
-        assists = participant.get("assists", 0)
-        kda = (kills + assists) / max(deaths, 1)
-        if participant.get("win", False):
+    for idx, game in enumerate(extract_player_games(matches, player_puuid)):
+        kda = (game.kills + game.assists) / max(game.deaths, 1)
+        if game.win:
             wins += 1
         win_rate = wins / (idx + 1) * 100
         trend_points.append({"kda": kda, "cumulative_win_rate": win_rate})
@@ -131,31 +167,32 @@ def load_player_match_data(
     include_aram: bool = False,
     queue_filter: Optional[list[int]] = None,
     game_mode_whitelist: Optional[list[str]] = None,
+    matches: Optional[list[dict[str, Any]]] = None,
 ) -> list[dict[str, Any]]:
     """
     Load match data for a specific player.
     Args:
         player_puuid (str): PUUID of the player
         matches_dir (str): Directory containing match JSON files
+        matches (list, optional): Already loaded and filtered matches; when
+            given, ``matches_dir`` and the filter arguments are ignored
     Returns:
         list[dict]: List of match data for the player
     """
-    raw_matches: list[dict[str, Any]] = analyze.load_match_files(matches_dir)
-    matches = filter_matches(
-        raw_matches,
-        include_aram=include_aram,
-        allowed_queue_ids=queue_filter,
-        allowed_game_modes=game_mode_whitelist,
-    )
+    if matches is None:
+        matches = filter_matches(
+            analyze.load_match_files(matches_dir),
+            include_aram=include_aram,
+            allowed_queue_ids=queue_filter,
+            allowed_game_modes=game_mode_whitelist,
+        )
     player_matches: list[dict[str, Any]] = []
     for match in matches:
         if "info" not in match or "participants" not in match["info"]:
             continue
         # Check if player participated in this match
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_matches.append(match)
-                break
+        if find_participant(match, player_puuid) is not None:
+            player_matches.append(match)
     return player_matches
 
 
@@ -167,6 +204,7 @@ def plot_champion_performance(
     include_aram: bool = False,
     queue_filter: Optional[list[int]] = None,
     game_mode_whitelist: Optional[list[str]] = None,
+    matches: Optional[list[dict[str, Any]]] = None,
 ):
     """
     Plot performance statistics by champion.
@@ -177,6 +215,7 @@ def plot_champion_performance(
         include_aram=include_aram,
         queue_filter=queue_filter,
         game_mode_whitelist=game_mode_whitelist,
+        matches=matches,
     )
 
     if not matches:
@@ -186,44 +225,18 @@ def plot_champion_performance(
         plt.show()
         return
 
-    champion_stats = {}
+    champion_stats: defaultdict[str, dict[str, float]] = defaultdict(_empty_perf_stats)
 
-    for match in matches:
-        # Find player data in this match
-        player_data = None
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_data = participant
-                break
-
-        if not player_data:
-            continue
-
-        champion = player_data.get("championName", "Unknown")
-
-        if champion not in champion_stats:
-            champion_stats[champion] = {
-                "games": 0,
-                "wins": 0,
-                "total_kda": 0,
-                "total_damage": 0,
-                "total_gold": 0,
-            }
-
-        stats = champion_stats[champion]
+    for game in extract_player_games(matches, player_puuid):
+        stats = champion_stats[game.champion]
         stats["games"] += 1
 
-        if player_data.get("win", False):
+        if game.win:
             stats["wins"] += 1
 
-        kills = player_data.get("kills", 0)
-        deaths = player_data.get("deaths", 0)
-        assists = player_data.get("assists", 0)
-        kda = (kills + assists) / max(deaths, 1)
-
-        stats["total_kda"] += kda
-        stats["total_damage"] += player_data.get("totalDamageDealtToChampions", 0)
-        stats["total_gold"] += player_data.get("goldEarned", 0)
+        stats["total_kda"] += (game.kills + game.assists) / max(game.deaths, 1)
+        stats["total_damage"] += game.damage
+        stats["total_gold"] += game.gold
 
     # Filter champions with at least 2 games and get top 8
     filtered_champions = {
@@ -289,6 +302,7 @@ def plot_role_performance(
     include_aram: bool = False,
     queue_filter: Optional[list[int]] = None,
     game_mode_whitelist: Optional[list[str]] = None,
+    matches: Optional[list[dict[str, Any]]] = None,
 ):
     """
     Plot performance statistics by role/position.
@@ -299,48 +313,21 @@ def plot_role_performance(
         include_aram=include_aram,
         queue_filter=queue_filter,
         game_mode_whitelist=game_mode_whitelist,
+        matches=matches,
     )
 
-    role_stats = {}
-
-    for match in matches:
-        # Find player data in this match
-        player_data = None
-        for participant in match["info"]["participants"]:
-            if participant.get("puuid") == player_puuid:
-                player_data = participant
-                break
-
-        if not player_data:
-            continue
-
-        role = player_data.get("teamPosition", "Unknown")
-        if role == "":
-            role = "Unknown"
+    role_stats: defaultdict[str, dict[str, float]] = defaultdict(_empty_perf_stats)
 
-        if role not in role_stats:
-            role_stats[role] = {
-                "games": 0,
-                "wins": 0,
-                "total_kda": 0,
-                "total_damage": 0,
-                "total_gold": 0,
-            }
-
-        stats = role_stats[role]
+    for game in extract_player_games(matches, player_puuid):
+        stats = role_stats[game.role or "Unknown"]
         stats["games"] += 1
 
-        if player_data.get("win", False):
+        if game.win:
             stats["wins"] += 1
 
-        kills = player_data.get("kills", 0)
-        deaths = player_data.get("deaths", 0)
-        assists = player_data.get("assists", 0)
-        kda = (kills + assists) / max(deaths, 1)
-
-        stats["total_kda"] += kda
-        stats["total_damage"] += player_data.get("totalDamageDealtToChampions", 0)
-        stats["total_gold"] += player_data.get("goldEarned", 0)
+        stats["total_kda"] += (game.kills + game.assists) / max(game.deaths, 1)
+        stats["total_damage"] += game.damage
+        stats["total_gold"] += game.gold
 
     # Filter roles with at least 1 game
     filtered_roles = {role: stats for role, stats in role_stats.items() if stats["games"] >= 1}
@@ -407,20 +394,12 @@ def plot_role_performance(
 def fetch_puuid_by_riot_id(game_name: str, tag_line: str, token: str) -> str:
     """
     Fetch PUUID for a player using their Riot ID (game name + tag line).
+
+    Delegates to ``league.fetch_puuid_by_riot_id`` so the lookup reuses the
+    shared pooled/retrying HTTP session.
     """
-    base_url = "https://americas.api.riotgames.com"
-    url = f"{base_url}/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
-    headers = {"X-Riot-Token": token}
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        if not isinstance(data, dict) or "puuid" not in data:
-            raise ValueError("Invalid response format - missing PUUID")
-        puuid_val = data.get("puuid")
-        if not isinstance(puuid_val, str):
-            raise ValueError("PUUID field not a string")
-        return puuid_val
+        return league.fetch_puuid_by_riot_id(game_name, tag_line, token)
     except Exception as e:  # pragma: no cover - network error path
         print(f"Error fetching PUUID for {game_name}#{tag_line}: {e}")
         raise
@@ -0,0 +1,271 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))  # noqa: E402
+from stats_visualization import analyze  # noqa: E402
+
+
+class TestLoadMatchFiles(unittest.TestCase):
+    def setUp(self) -> None:
+        analyze._MATCH_MEMORY_CACHE.clear()
+        self.addCleanup(analyze._MATCH_MEMORY_CACHE.clear)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.matches_dir = Path(self._tmp.name)
+        for i in range(3):
+            (self.matches_dir / f"EUW1_{i}.json").write_text(
+                json.dumps({"metadata": {"matchId": f"EUW1_{i}"}, "info": {"gameId": i}}),
+                encoding="utf-8",
+            )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_cache_written_and_reused(self):
+        """Second load is served from the parsed-match cache without re-parsing"""
+        first = analyze.load_match_files(str(self.matches_dir))
+        self.assertEqual(len(first), 3)
+        self.assertTrue((self.matches_dir / analyze.MATCH_CACHE_FILENAME).exists())
+
+        analyze._MATCH_MEMORY_CACHE.clear()
+        with patch("stats_visualization.analyze.load_match_json") as mock_loads:
+            second = analyze.load_match_files(str(self.matches_dir))
+        mock_loads.assert_not_called()
+        self.assertEqual(
+            sorted(m["info"]["gameId"] for m in second),
+            sorted(m["info"]["gameId"] for m in first),
+        )
+
+    def test_repeat_load_skips_cache_file_read(self):
+        """Later loads in the same process reuse the in-memory cache"""
+        first = analyze.load_match_files(str(self.matches_dir))
+        with patch("stats_visualization.analyze._read_match_cache") as mock_read, patch(
+            "stats_visualization.analyze.load_match_json"
+        ) as mock_loads:
+            second = analyze.load_match_files(str(self.matches_dir))
+        mock_read.assert_not_called()
+        mock_loads.assert_not_called()
+        self.assertEqual(second, first)
+
+    def test_modified_file_is_reparsed(self):
+        """Files whose size/mtime changed are parsed again"""
+        analyze.load_match_files(str(self.matches_dir))
+        (self.matches_dir / "EUW1_0.json").write_text(
+            json.dumps({"metadata": {"matchId": "EUW1_0"}, "info": {"gameId": 100}}),
+            encoding="utf-8",
+        )
+        (self.matches_dir / "EUW1_2.json").unlink()
+
+        matches = analyze.load_match_files(str(self.matches_dir))
+        self.assertEqual(sorted(m["info"]["gameId"] for m in matches), [1, 100])
+
+    def test_use_cache_false_skips_cache(self):
+        """use_cache=False neither writes nor reads the parsed-match cache"""
+        analyze.load_match_files(str(self.matches_dir), use_cache=False)
+        self.assertFalse((self.matches_dir / analyze.MATCH_CACHE_FILENAME).exists())
+
+    def test_corrupt_cache_is_ignored(self):
+        """An unreadable cache file falls back to parsing JSON"""
+        (self.matches_dir / analyze.MATCH_CACHE_FILENAME).write_bytes(b"not json")
+        matches = analyze.load_match_files(str(self.matches_dir))
+        self.assertEqual(len(matches), 3)
+
+    def test_cache_is_json_and_drops_malformed_entries(self):
+        """The cache is plain JSON; entries of the wrong shape are re-parsed"""
+        analyze.load_match_files(str(self.matches_dir))
+        cache_path = self.matches_dir / analyze.MATCH_CACHE_FILENAME
+        raw = json.loads(cache_path.read_bytes())
+        self.assertEqual(sorted(raw), ["EUW1_0.json", "EUW1_1.json", "EUW1_2.json"])
+        raw["EUW1_1.json"] = "tampered"
+        cache_path.write_text(json.dumps(raw), encoding="utf-8")
+
+        cache = analyze._read_match_cache(cache_path)
+        self.assertEqual(sorted(cache), ["EUW1_0.json", "EUW1_2.json"])
+        self.assertEqual(cache["EUW1_0.json"][2]["info"]["gameId"], 0)
+
+    def test_parallel_parse_skips_bad_files(self):
+        """Files parsed on the worker pool keep per-file error handling"""
+        (self.matches_dir / "broken.json").write_text("{not json", encoding="utf-8")
+        matches = analyze.load_match_files(str(self.matches_dir))
+        self.assertEqual(sorted(m["info"]["gameId"] for m in matches), [0, 1, 2])
+        self.assertNotIn("broken.json", analyze._MATCH_MEMORY_CACHE[str(self.matches_dir)])
+
+    def test_header_prefilter_skips_rejected_files(self):
+        """Uncached files whose header fails the filters are never fully parsed"""
+        for name, mode, queue in (("aram", "ARAM", 450), ("flex", "CLASSIC", 440)):
+            (self.matches_dir / f"{name}.json").write_text(
+                json.dumps({"info": {"gameMode": mode, "queueId": queue, "gameId": name}}),
+                encoding="utf-8",
+            )
+        with patch(
+            "stats_visualization.analyze.load_match_json", wraps=analyze.load_match_json
+        ) as mock_loads:
+            matches = analyze.load_match_files(
+                str(self.matches_dir), include_aram=False, queue_filter=[420]
+            )
+        parsed = {Path(c.args[0]).name for c in mock_loads.call_args_list}
+        self.assertNotIn("aram.json", parsed)
+        self.assertNotIn("flex.json", parsed)
+        self.assertEqual(sorted(m["info"]["gameId"] for m in matches), [0, 1, 2])
+
+        # Skipped files are not cached as absent: an unfiltered load returns them
+        matches = analyze.load_match_files(str(self.matches_dir))
+        self.assertEqual(len(matches), 5)
+
+
+class TestTeamPerformance(unittest.TestCase):
+    def test_objective_totals_and_averages(self):
+        """Objective totals sum both teams; averages use all matches"""
+
+        def team(dragon, baron, herald, tower):
+            return {
+                "objectives": {
+                    "dragon": {"kills": dragon},
+                    "baron": {"kills": baron},
+                    "riftHerald": {"kills": herald},
+                    "tower": {"kills": tower},
+                }
+            }
+
+        matches = [
+            {
+                "info": {
+                    "gameMode": "CLASSIC",
+                    "gameType": "MATCHED_GAME",
+                    "gameDuration": 1800,
+                    "teams": [team(3, 1, 1, 8), team(1, 0, 1, 2)],
+                }
+            },
+            {"info": {"gameMode": "ARAM", "gameDuration": 1200}},
+            {"metadata": {}},
+        ]
+
+        stats = analyze.analyze_team_performance(matches)
+
+        self.assertEqual(stats["total_matches"], 3)
+        self.assertEqual(stats["game_modes"], {"CLASSIC": 1, "ARAM": 1})
+        self.assertEqual(stats["game_types"], {"MATCHED_GAME": 1, "Unknown": 1})
+        self.assertEqual(stats["average_duration"], 1000)
+        self.assertEqual(stats["objectives"]["dragons"]["total"], 4)
+        self.assertEqual(stats["objectives"]["towers"]["total"], 10)
+        self.assertAlmostEqual(stats["objectives"]["heralds"]["avg_per_game"], 2 / 3)
+        self.assertIsInstance(stats["objectives"]["barons"]["total"], int)
+
+        arrays = analyze.matches_to_arrays(matches)
+        self.assertEqual(arrays.objectives.shape, (2, 4))
+        self.assertEqual(arrays.dragons.tolist(), [4, 0])
+        self.assertEqual(analyze.matches_to_arrays([]).objectives.shape, (0, 4))
+
+
+class TestPlayerPerformance(unittest.TestCase):
+    def setUp(self) -> None:
+        self.matches = [
+            {
+                "info": {
+                    "gameDuration": 1500,
+                    "participants": [
+                        {
+                            "puuid": "me",
+                            "win": True,
+                            "kills": 5,
+                            "deaths": 1,
+                            "assists": 3,
+                            "championName": "Ahri",
+                        },
+                        {"puuid": "other", "win": False, "kills": 2, "deaths": 4},
+                    ],
+                }
+            },
+            {
+                "info": {
+                    "gameDuration": 2100,
+                    "participants": [{"puuid": "me", "win": False, "kills": 1, "deaths": 3}],
+                }
+            },
+            {"info": {"participants": [{"puuid": "other", "win": True}]}},
+            {"metadata": {}},
+        ]
+
+    def test_index_participants(self):
+        """Index maps each puuid to its (match index, participant) rows"""
+        index = analyze.index_participants(self.matches)
+        self.assertEqual([mi for mi, _ in index["me"]], [0, 1])
+        self.assertEqual([mi for mi, _ in index["other"]], [0, 2])
+
+    def test_prebuilt_index_matches_on_demand(self):
+        """Passing a prebuilt index gives the same stats as building it internally"""
+        index = analyze.index_participants(self.matches)
+        stats = analyze.analyze_player_performance(self.matches, "me", index)
+        self.assertEqual(stats, analyze.analyze_player_performance(self.matches, "me"))
+        self.assertEqual(stats["total_games"], 2)
+        self.assertEqual((stats["wins"], stats["losses"]), (1, 1))
+        self.assertEqual(stats["average_game_duration"], 1800)
+        self.assertEqual(stats["champions_played"], {"Ahri": 1, "Unknown": 1})
+        self.assertEqual(stats["roles_played"], {"Unknown": 2})
+        self.assertEqual(
+            analyze.analyze_player_performance(self.matches, "nobody")["total_games"], 0
+        )
+
+    def test_complete_participant_fields(self):
+        """Participants carrying every field take the itemgetter fast path"""
+        full = {
+            "puuid": "me",
+            "win": True,
+            "kills": 4,
+            "deaths": 2,
+            "assists": 6,
+            "totalDamageDealtToChampions": 20000,
+            "goldEarned": 11000,
+        }
+        matches = [{"info": {"gameDuration": 1600, "participants": [full]}}]
+        stats = analyze.analyze_player_performance(matches, "me")
+        self.assertEqual(stats["total_damage"], 20000)
+        self.assertEqual(stats["total_gold"], 11000)
+        self.assertEqual(stats["average_kda"], 5)
+
+
+class TestFetchPuuidAnyCase(unittest.TestCase):
+    _TARGET = "stats_visualization.league.fetch_puuid_by_riot_id"
+
+    def test_exact_spelling_resolves_with_one_request(self):
+        """The Riot ID as typed is tried first and alone"""
+        with patch(self._TARGET, return_value="puuid-1") as mock_fetch:
+            self.assertEqual(analyze._fetch_puuid_any_case("Name", "Tag", "tok"), ("puuid-1", None))
+        mock_fetch.assert_called_once_with("Name", "Tag", "tok")
+
+    def test_casing_variants_tried_after_not_found(self):
+        """A not-found ID retries the other casings and keeps the first success"""
+
+        def fetch(game_name, tag_line, _token):
+            if (game_name, tag_line) == ("name", "tag"):
+                return "puuid-2"
+            raise ValueError("Player not found")
+
+        with patch(self._TARGET, side_effect=fetch) as mock_fetch:
+            puuid, error = analyze._fetch_puuid_any_case("Name", "Tag", "tok")
+        self.assertEqual((puuid, error), ("puuid-2", None))
+        self.assertEqual(mock_fetch.call_args_list[0].args, ("Name", "Tag", "tok"))
+
+    def test_non_404_error_stops_search(self):
+        """Errors that every casing would hit (e.g. 403) are not retried"""
+        error = Exception("forbidden")
+        error.response = type("Resp", (), {"status_code": 403})()  # type: ignore[attr-defined]
+        with patch(self._TARGET, side_effect=error) as mock_fetch:
+            self.assertEqual(analyze._fetch_puuid_any_case("Name", "Tag", "tok"), (None, error))
+        mock_fetch.assert_called_once()
+
+    def test_response_less_error_stops_search(self):
+        """Timeouts / connection errors carry no status and are not retried per casing"""
+        error = TimeoutError("read timed out")
+        with patch(self._TARGET, side_effect=error) as mock_fetch:
+            self.assertEqual(analyze._fetch_puuid_any_case("Name", "Tag", "tok"), (None, error))
+        mock_fetch.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
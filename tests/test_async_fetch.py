@@ -158,6 +158,35 @@ class TestAsyncFunctionalities(unittest.TestCase):
         except ImportError:
             self.assertTrue(True, "httpx graceful fallback would work")
 
+    def test_retryable_get_retries_rate_limits_and_server_errors(self):
+        """429/5xx are retried (Retry-After, else backoff); the final success is returned"""
+        import asyncio
+        import httpx
+        from stats_visualization import async_fetch
+
+        replies = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "3"}),
+                httpx.Response(503),
+                httpx.Response(200, content=b'{"ok": true}'),
+            ]
+        )
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: next(replies))
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await async_fetch._retryable_get(client, "https://riot.test/x", {})
+
+        with patch("stats_visualization.async_fetch.asyncio.sleep", side_effect=fake_sleep):
+            resp = asyncio.run(run())
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([d for d in sleeps if d >= 0.5], [3.0, 1.0])
+
     @patch("stats_visualization.league.logger")
     def test_metrics_print_summary(self, mock_logger):
         """Test metrics summary printing."""
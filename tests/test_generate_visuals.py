@@ -87,7 +87,13 @@ class TestGenerateAllVisuals(unittest.TestCase):
             _swap(_bh, "plot_baron_herald_analysis", _plot("barons_heralds"))
 
             # Objectives
-            _swap(_oa, "extract_objective_data", lambda *a, **k: {"ok": True})  # noqa: E731
+            objective_extractions: list[dict] = []
+
+            def _extract_objectives(*_a: object, **k: object) -> dict:  # noqa: WPS430
+                objective_extractions.append(k)
+                return {"ok": True}
+
+            _swap(_oa, "extract_objective_data", _extract_objectives)
             _swap(_oa, "plot_objective_control", _plot("objectives_control"))
             _swap(_oa, "plot_first_objectives", _plot("objectives_first"))
             _swap(
@@ -110,6 +116,14 @@ class TestGenerateAllVisuals(unittest.TestCase):
             _swap(_jc, "extract_jungle_clear_data", lambda *a, **k: {})  # noqa: E731
             _swap(_jc, "plot_jungle_clear_analysis", _plot("jungle_clear"))
 
+            load_kwargs: list[dict] = []
+
+            def _load_stub(*_a: object, **k: object) -> list:  # noqa: WPS430
+                load_kwargs.append(k)
+                return []
+
+            _swap(analyze, "load_match_files", _load_stub)
+
             buf = io.StringIO()
             with redirect_stdout(buf):
                 analyze.generate_all_visuals(
@@ -117,6 +131,7 @@ class TestGenerateAllVisuals(unittest.TestCase):
                     "puuid-123",
                     clean=True,
                     include_aram=False,
+                    use_cache=False,
                 )
             output = buf.getvalue()
 
@@ -142,6 +157,12 @@ class TestGenerateAllVisuals(unittest.TestCase):
             self.assertEqual(set(calls), expected_labels)
             self.assertEqual(len(calls), len(expected_labels))
             self.assertIn("15/15 succeeded", output)
+            # Matches are loaded once, honouring --no-match-cache
+            self.assertEqual(load_kwargs, [{"use_cache": False}])
+            # One objective extraction feeds all three objective charts, and it
+            # is handed the preloaded matches instead of re-reading the directory
+            self.assertEqual(len(objective_extractions), 1)
+            self.assertIsInstance(objective_extractions[0].get("matches"), list)
         finally:
             for module, attr, original in originals:
                 setattr(module, attr, original)
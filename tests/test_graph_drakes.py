@@ -72,6 +72,16 @@ class TestGraphDrakes(unittest.TestCase):
             self.assertEqual(result["enemy_team_drakes"], [1])
             self.assertEqual(result["wins"], [True])
 
+    def test_extract_drake_data_preloaded_matches(self) -> None:
+        with patch(
+            "stats_visualization.visualizations.graph_drakes.analyze.load_match_files"
+        ) as mock_load:
+            result = graph_drakes.extract_drake_data(
+                self.test_puuid, matches=[self.mock_match_data]
+            )
+        mock_load.assert_not_called()
+        self.assertEqual(result["player_team_drakes"], [3])
+
     def test_plot_drake_analysis(self) -> None:
         # Provide mock data with at least one game to trigger plotting
         mock_data: Dict[str, Any] = {
@@ -152,6 +152,19 @@ class TestJungleClearAnalysis(unittest.TestCase):
         self.assertIsNotNone(clear_time)
         self.assertLess(clear_time, 3.5)  # Fast clearer should be under 3.5 minutes
 
+    def test_estimate_clear_time_uses_riot_champion_names(self):
+        from jungle_clear_analysis import estimate_clear_time_from_stats
+
+        base = {"neutralMinionsKilled": 100, "totalMinionsKilled": 120}
+        self.assertEqual(
+            estimate_clear_time_from_stats({**base, "championName": "LeeSin"}),
+            estimate_clear_time_from_stats({**base, "championName": "Lee Sin"}),
+        )
+        self.assertNotEqual(
+            estimate_clear_time_from_stats({**base, "championName": "LeeSin"}),
+            estimate_clear_time_from_stats({**base, "championName": "Jinx"}),
+        )
+
     def test_estimate_clear_time_from_stats_low_cs(self):
         from jungle_clear_analysis import estimate_clear_time_from_stats
 
@@ -1,15 +1,25 @@
+import asyncio
+import gzip
+import json
 import unittest
 import sys
 import os
-from unittest.mock import patch, Mock, mock_open
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch, AsyncMock, Mock
 
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))  # noqa: E402
-from stats_visualization import league  # noqa: E402
+from stats_visualization import league, utils  # noqa: E402
 
 
 class TestLeagueModule(unittest.TestCase):
 
+    def setUp(self):
+        league.load_player_config.cache_clear()
+        self.addCleanup(league.load_player_config.cache_clear)
+
     def test_load_player_config_from_env(self):
         """Test loading player config from environment variables"""
         with patch.dict(
@@ -29,11 +39,20 @@ class TestLeagueModule(unittest.TestCase):
                 self.assertIn("Overowser", config)
                 self.assertIn("Suro", config)
 
-    @patch("stats_visualization.league.requests.get")
+    def test_load_player_config_is_memoized(self):
+        """Repeated calls return the cached mapping without rescanning the env"""
+        with patch.dict(os.environ, {"PUUID_FROWTCH": "first"}):
+            first = league.load_player_config()
+        with patch.dict(os.environ, {"PUUID_FROWTCH": "second"}):
+            self.assertIs(league.load_player_config(), first)
+            league.load_player_config.cache_clear()
+            self.assertEqual(league.load_player_config()["Frowtch"], "second")
+
+    @patch("stats_visualization.league._session.get")
     def test_fetch_match_data_success(self, mock_get):
         """Test successful match data fetch"""
         mock_response = Mock()
-        mock_response.json.return_value = {"gameId": 12345}
+        mock_response.content = b'{"gameId": 12345}'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -42,7 +61,47 @@ class TestLeagueModule(unittest.TestCase):
         self.assertEqual(result, {"gameId": 12345})
         mock_get.assert_called_once()
 
-    @patch("stats_visualization.league.requests.get")
+    @patch("stats_visualization.league.fetch_timeline_data")
+    @patch("stats_visualization.league.fetch_match_data")
+    def test_fetch_match_with_timeline_overlaps_requests(self, mock_fetch, mock_timeline):
+        """The timeline GET runs while the match GET is still in flight"""
+        timeline_started = threading.Event()
+        mock_timeline.side_effect = lambda mid, token: timeline_started.set() or {"frames": []}
+        mock_fetch.side_effect = lambda mid, token: {
+            "gameId": 1,
+            "overlapped": timeline_started.wait(timeout=2),
+        }
+
+        result = league.fetch_match_with_timeline("m1", "test_token")
+
+        self.assertTrue(result["overlapped"])
+        self.assertEqual(result["timeline"], {"frames": []})
+
+    def test_token_bucket_paces_after_burst(self):
+        """Bucket allows `capacity` immediate calls, then spaces them at `rate`"""
+        from stats_visualization.utils import TokenBucket
+
+        with patch("stats_visualization.utils.time.monotonic", return_value=100.0) as clock:
+            bucket = TokenBucket(rate=10, capacity=2)
+            waits = [bucket.reserve() for _ in range(4)]
+            self.assertEqual(waits[:2], [0.0, 0.0])
+            self.assertAlmostEqual(waits[2], 0.1)
+            self.assertAlmostEqual(waits[3], 0.2)
+
+            clock.return_value = 101.0  # fully refilled, capped at capacity
+            self.assertEqual(bucket.reserve(), 0.0)
+            self.assertEqual(bucket.reserve(), 0.0)
+            self.assertAlmostEqual(bucket.reserve(), 0.1)
+
+    @patch("stats_visualization.league.RIOT_RATE_LIMITER")
+    @patch("stats_visualization.league._session.get")
+    def test_requests_take_rate_limit_token(self, mock_get, mock_limiter):
+        """Every sync Riot API call goes through the shared token bucket"""
+        mock_get.return_value = Mock(status_code=200, content=b'{"gameId": 1}', headers={})
+        league.fetch_match_data("m1", "test_token")
+        mock_limiter.acquire.assert_called_once()
+
+    @patch("stats_visualization.league._session.get")
     def test_fetch_match_data_failure(self, mock_get):
         """Test match data fetch failure"""
         mock_get.side_effect = league.requests.exceptions.RequestException("API Error")
@@ -50,26 +109,55 @@ class TestLeagueModule(unittest.TestCase):
         with self.assertRaises(league.requests.exceptions.RequestException):
             league.fetch_match_data("test_match_id", "test_token")
 
-    @patch("stats_visualization.league.Path.mkdir")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("stats_visualization.league.json.dump")
-    def test_save_match_data(self, mock_json_dump, mock_file, mock_mkdir):
-        """Test saving match data to file"""
+    def test_save_match_data(self):
+        """Match data is written as compact JSON via an atomic tmp-file replace"""
         test_data = {"gameId": 12345}
 
-        league.save_match_data("test_match_id", test_data)
-
-        mock_mkdir.assert_called_once_with(exist_ok=True)
-        mock_file.assert_called_once()
-        mock_json_dump.assert_called_once_with(
-            test_data, mock_file.return_value.__enter__.return_value, indent=4
-        )
-
-    @patch("stats_visualization.league.requests.get")
+        with tempfile.TemporaryDirectory() as tmp:
+            matches_dir = Path(tmp, "matches")
+            with patch("stats_visualization.league.MATCHES_DIR", str(matches_dir)), patch(
+                "stats_visualization.utils.os.replace", wraps=os.replace
+            ) as mock_replace:
+                league.save_match_data("test_match_id", test_data)
+
+            written = (matches_dir / "test_match_id.json").read_bytes()
+            self.assertEqual(json.loads(written), test_data)
+            self.assertNotIn(b"\n", written)
+            self.assertEqual(os.listdir(matches_dir), ["test_match_id.json"])
+            mock_replace.assert_called_once()
+
+    def test_save_match_data_compressed_round_trip(self):
+        """compress=True stores one .json.gz that every reader understands"""
+        from stats_visualization import analyze
+
+        data = {"metadata": {"matchId": "m1"}, "info": {"participants": [{"puuid": "me"}]}}
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("stats_visualization.league.MATCHES_DIR", tmp):
+                league.save_match_data("m1", data)
+                league.save_match_data("m1", data, compress=True)
+                self.assertEqual(os.listdir(tmp), ["m1.json.gz"])
+                self.assertTrue(league._is_cached_match("m1"))
+
+            self.assertEqual(utils.count_player_match_files(tmp, "me"), 1)
+            self.assertEqual(analyze.load_match_files(tmp, use_cache=False), [data])
+
+    def test_save_match_data_keeps_old_file_on_failure(self):
+        """A failed write leaves the previous file intact and no tmp file behind"""
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("stats_visualization.league.MATCHES_DIR", tmp):
+                league.save_match_data("m1", {"gameId": 1})
+                with patch("stats_visualization.utils.os.replace", side_effect=OSError("disk")):
+                    with self.assertRaises(OSError):
+                        league.save_match_data("m1", {"gameId": 2})
+
+            self.assertEqual(json.loads(Path(tmp, "m1.json").read_bytes()), {"gameId": 1})
+            self.assertEqual(os.listdir(tmp), ["m1.json"])
+
+    @patch("stats_visualization.league._session.get")
     def test_fetch_match_history_success(self, mock_get):
         """Test successful match history fetch"""
         mock_response = Mock()
-        mock_response.json.return_value = ["match1", "match2", "match3"]
+        mock_response.content = json.dumps(["match1", "match2", "match3"]).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -78,6 +166,32 @@ class TestLeagueModule(unittest.TestCase):
         self.assertEqual(result, ["match1", "match2", "match3"])
         mock_get.assert_called_once()
 
+    @patch("stats_visualization.league._session.get")
+    def test_fetch_match_history_pages_concurrently(self, mock_get):
+        """Counts above 100 are split into pages; a short page ends the history"""
+
+        def page(url, **kwargs):
+            start = int(url.split("start=")[1].split("&")[0])
+            size = {0: 100, 100: 30, 200: 0}[start]
+            return Mock(content=json.dumps([f"m{start + i}" for i in range(size)]).encode())
+
+        mock_get.side_effect = page
+        result = league.fetch_match_history("test_puuid", 250, "test_token")
+
+        self.assertEqual(result, [f"m{i}" for i in range(130)])
+        counts = sorted(c.args[0].split("count=")[1] for c in mock_get.call_args_list)
+        self.assertEqual(counts, ["100", "100", "50"])
+
+    @patch("stats_visualization.league._session.get")
+    def test_fetch_match_history_short_first_page(self, mock_get):
+        """A short first page ends the history without requesting later pages"""
+        mock_get.return_value = Mock(content=json.dumps(["m0", "m1"]).encode())
+
+        result = league.fetch_match_history("test_puuid", 250, "test_token")
+
+        self.assertEqual(result, ["m0", "m1"])
+        mock_get.assert_called_once()
+
     @patch("stats_visualization.league.fetch_match_data")
     @patch("stats_visualization.league.save_match_data")
     def test_process_matches(self, mock_save, mock_fetch):
@@ -89,15 +203,222 @@ class TestLeagueModule(unittest.TestCase):
         self.assertEqual(mock_fetch.call_count, 2)
         self.assertEqual(mock_save.call_count, 2)
 
+    @patch("stats_visualization.league.fetch_match_data")
+    @patch("stats_visualization.league.save_match_data")
+    def test_process_matches_continues_after_failure(self, mock_save, mock_fetch):
+        """A failed fetch is logged and does not stop the other workers"""
+
+        def fetch(mid, token):
+            if mid == "bad":
+                raise league.requests.exceptions.HTTPError("404")
+            return {"gameId": mid}
+
+        mock_fetch.side_effect = fetch
+        with patch("stats_visualization.league.logger") as mock_logger:
+            league.process_matches(["a", "bad", "b"], "test_token", use_cache=False)
+
+        self.assertEqual(sorted(c[0][0] for c in mock_save.call_args_list), ["a", "b"])
+        mock_logger.error.assert_called_once()
+
+    def test_count_player_match_files_streams_across_chunks(self):
+        """PUUIDs split across read chunks are still found, in plain and gzip files"""
+        import gzip
+
+        payload = b'{"metadata": {"participants": ["x", "player-puuid"]}, "info": {}}'
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "a.json").write_bytes(payload)
+            Path(tmp, "b.json.gz").write_bytes(gzip.compress(payload))
+            Path(tmp, "c.json").write_bytes(payload.replace(b"player-puuid", b"other"))
+            with patch("stats_visualization.utils._SCAN_CHUNK_SIZE", 7):
+                self.assertEqual(utils.count_player_match_files(tmp, "player-puuid"), 2)
+
+    @patch("stats_visualization.league.fetch_match_with_timeline")
+    @patch("stats_visualization.league.fetch_timeline_data")
+    @patch("stats_visualization.league.fetch_match_data")
+    @patch("stats_visualization.league.save_match_data")
+    def test_process_matches_include_timeline(
+        self, mock_save, mock_fetch_match, mock_fetch_tl, mock_fetch_both
+    ):
+        """Timeline GETs run as separate tasks on the pool and are merged into the match"""
+        mock_fetch_match.return_value = {"gameId": 1}
+        mock_fetch_tl.return_value = {"frames": []}
+
+        league.process_matches(
+            ["m1"], "test_token", use_cache=False, include_timeline=True, pretty=True
+        )
+
+        mock_fetch_match.assert_called_once_with("m1", "test_token")
+        mock_fetch_tl.assert_called_once_with("m1", "test_token")
+        mock_fetch_both.assert_not_called()
+        mock_save.assert_called_once_with(
+            "m1", {"gameId": 1, "timeline": {"frames": []}}, pretty=True, compress=False
+        )
+
+    def test_count_player_match_files_matches_quoted_puuid(self):
+        """Player match counting checks raw bytes without parsing JSON"""
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "a.json").write_bytes(b'{"metadata": {"participants": ["me", "x"]}}')
+            Path(tmp, "b.json").write_bytes(b'{"metadata": {"participants": ["meh"]}}')
+            Path(tmp, "notes.txt").write_bytes(b'"me"')
+            with patch("stats_visualization.utils.json_loads") as mock_loads:
+                self.assertEqual(utils.count_player_match_files(tmp, "me"), 1)
+            mock_loads.assert_not_called()
+
+    def test_load_match_json_small_large_and_gzip(self):
+        """Match files parse the same via read(), mmap and gzip paths"""
+        data = {"info": {"frames": list(range(10000))}}
+        with tempfile.TemporaryDirectory() as tmp:
+            small = Path(tmp, "small.json")
+            small.write_bytes(json.dumps({"info": {}}).encode())
+            large = Path(tmp, "large.json")
+            large.write_bytes(json.dumps(data).encode())
+            self.assertGreater(large.stat().st_size, utils._MMAP_MIN_SIZE)
+            gz = Path(tmp, "large.json.gz")
+            gz.write_bytes(gzip.compress(large.read_bytes()))
+
+            self.assertEqual(utils.load_match_json(small), {"info": {}})
+            self.assertEqual(utils.load_match_json(large), data)
+            self.assertEqual(utils.load_match_json(gz), data)
+
+    def test_find_participant_uses_metadata_order(self):
+        """Participants are located via metadata order, with a scan fallback"""
+        players = [{"puuid": "a", "kills": 1}, {"puuid": "me", "kills": 7}]
+        match = {"metadata": {"participants": ["a", "me"]}, "info": {"participants": players}}
+        self.assertIs(utils.find_participant(match, "me"), players[1])
+        self.assertIsNone(utils.find_participant(match, "nobody"))
+
+        match["metadata"]["participants"] = ["me", "a"]  # out of sync: scan instead
+        self.assertIs(utils.find_participant(match, "me"), players[1])
+        self.assertIs(utils.find_participant({"info": {"participants": players}}, "a"), players[0])
+        self.assertIsNone(utils.find_participant({"metadata": {}}, "me"))
+
+    def test_count_player_match_files_stops_at_limit(self):
+        """With a limit, counting stops once enough matches are found"""
+        with tempfile.TemporaryDirectory() as tmp:
+            for i in range(5):
+                Path(tmp, f"m{i}.json").write_bytes(b'{"metadata": {"participants": ["me"]}}')
+            self.assertEqual(utils.count_player_match_files(tmp, "me", limit=10), 5)
+            self.assertGreaterEqual(utils.count_player_match_files(tmp, "me", limit=1), 1)
+
+    @patch("stats_visualization.league.fetch_match_data")
+    def test_process_matches_skips_cached_files(self, mock_fetch):
+        """Non-empty cached files are skipped by stat alone; empty ones are refetched"""
+        mock_fetch.return_value = {"gameId": 1}
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "cached.json").write_bytes(b'{"info": {}}')
+            Path(tmp, "empty.json").write_bytes(b"")
+            with patch("stats_visualization.league.MATCHES_DIR", tmp), patch(
+                "stats_visualization.league.save_match_data"
+            ) as mock_save, patch("stats_visualization.league.json_loads") as mock_loads:
+                league.process_matches(["cached", "empty", "new"], "test_token")
+
+        mock_loads.assert_not_called()
+        self.assertEqual([c[0][0] for c in mock_fetch.call_args_list], ["empty", "new"])
+        self.assertEqual(mock_save.call_count, 2)
+
+    @patch("stats_visualization.league.save_match_data")
+    @patch("stats_visualization.league._is_cached_match")
+    @patch("stats_visualization.async_fetch.fetch_match", new_callable=AsyncMock)
+    def test_async_process_matches_skips_cached(self, mock_fetch, mock_cached, mock_save):
+        """Async path skips cached IDs and saves fetched ones (off the event loop)"""
+        mock_cached.side_effect = lambda mid: mid == "cached"
+        mock_fetch.return_value = {"metadata": {"matchId": "new"}, "info": {"gameId": 1}}
+
+        asyncio.run(league.async_process_matches(["cached", "new"], "test_token"))
+
+        mock_fetch.assert_awaited_once()
+        self.assertEqual(mock_fetch.await_args[0][0], "new")
+        mock_save.assert_called_once_with(
+            "new", mock_fetch.return_value, pretty=False, compress=False
+        )
+
+    @patch("stats_visualization.league._is_cached_match", return_value=False)
+    @patch("stats_visualization.async_fetch.fetch_match", new_callable=AsyncMock)
+    def test_async_process_matches_saves_outside_fetch_slot(self, mock_fetch, _cached):
+        """With one fetch slot, the next download starts while the previous save runs"""
+        second_fetch_started = threading.Event()
+        overlapped = []
+
+        async def fetch(mid, token, client):
+            if mid == "b":
+                second_fetch_started.set()
+            return {"metadata": {"matchId": mid}, "info": {}}
+
+        def save(mid, data, **kwargs):
+            if mid == "a":
+                overlapped.append(second_fetch_started.wait(timeout=2))
+
+        mock_fetch.side_effect = fetch
+        with patch("stats_visualization.league.save_match_data", side_effect=save):
+            asyncio.run(league.async_process_matches(["a", "b"], "test_token", concurrency=1))
+
+        self.assertEqual(overlapped, [True])
+
+    @patch("stats_visualization.league.process_matches")
+    @patch("stats_visualization.league.async_process_matches", new_callable=Mock)
+    @patch("stats_visualization.league.importlib.util.find_spec")
+    def test_fetch_and_save_matches_dispatch(self, mock_find_spec, mock_async, mock_sync):
+        """Async fetch is used when httpx is importable, sync otherwise"""
+        mock_find_spec.return_value = object()
+        with patch("stats_visualization.league.asyncio.run") as mock_run:
+            league._fetch_and_save_matches(["match1"], "test_token")
+            mock_run.assert_called_once()
+        mock_sync.assert_not_called()
+
+        mock_find_spec.return_value = None
+        league._fetch_and_save_matches(["match1"], "test_token")
+        mock_sync.assert_called_once_with(
+            ["match1"], "test_token", use_cache=True, puuid_to_count=None
+        )
+
+    @patch("stats_visualization.league.fetch_match_history", return_value=["m1", "m2", "m3"])
+    @patch("stats_visualization.league.save_match_data")
+    @patch("stats_visualization.league.fetch_match_data")
+    @patch("stats_visualization.league.importlib.util.find_spec", return_value=None)
+    def test_ensure_matches_counts_fetched_payloads(
+        self, mock_find_spec, mock_fetch, mock_save, mock_history
+    ):
+        """New matches are counted from fetched data without rescanning the directory"""
+        mock_fetch.side_effect = lambda mid, token: {
+            "metadata": {"matchId": mid, "participants": ["me"] if mid != "m2" else ["x"]}
+        }
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "stats_visualization.league.MATCHES_DIR", tmp
+        ), patch("stats_visualization.league.count_player_matches", return_value=0) as mock_count:
+            result = league.ensure_matches_for_player(
+                "me", "test_token", matches_dir=tmp, min_matches=5
+            )
+
+        self.assertEqual(result, 2)
+        mock_count.assert_called_once()
+
+    @patch("stats_visualization.league.time.sleep")
+    @patch("stats_visualization.league.RIOT_RATE_LIMITER")
+    @patch("stats_visualization.league._session.get")
+    def test_riot_get_retries_through_rate_limiter(self, mock_get, mock_limiter, mock_sleep):
+        """429/5xx are retried in _riot_get, each attempt taking a rate-limit token"""
+        mock_get.side_effect = [
+            Mock(status_code=429, headers={"Retry-After": "3"}),
+            Mock(status_code=503, headers={}),
+            Mock(status_code=200, headers={}),
+        ]
+        resp = league._riot_get(league.API_REGION_BASE + "m1", {}, timeout=30)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(mock_limiter.acquire.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [3.0, 1.0])
+        # urllib3 no longer retries statuses behind the bucket's back
+        adapter = league._session.get_adapter(league.API_REGION_BASE)
+        self.assertFalse(adapter.max_retries.status_forcelist)
+        self.assertFalse(adapter.max_retries.respect_retry_after_header)
+
     @patch("stats_visualization.league.make_api_request")
     def test_fetch_puuid_by_riot_id_success(self, mock_make_request):
         """Test successful PUUID fetch by Riot ID"""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "puuid": "test_puuid_123",
-            "gameName": "TestPlayer",
-            "tagLine": "test",
-        }
+        mock_response.content = json.dumps(
+            {"puuid": "test_puuid_123", "gameName": "TestPlayer", "tagLine": "test"}
+        ).encode()
         mock_make_request.return_value = mock_response
 
         result = league.fetch_puuid_by_riot_id("TestPlayer", "test", "test_token")
@@ -125,7 +446,7 @@ class TestLeagueModule(unittest.TestCase):
     def test_fetch_puuid_by_riot_id_invalid_response(self, mock_make_request):
         """Test PUUID fetch with invalid response format"""
         mock_response = Mock()
-        mock_response.json.return_value = {"invalid": "response"}
+        mock_response.content = b'{"invalid": "response"}'
         mock_make_request.return_value = mock_response
 
         with self.assertRaises(ValueError) as context:
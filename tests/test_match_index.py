@@ -0,0 +1,68 @@
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))  # noqa: E402
+from stats_visualization import match_index  # noqa: E402
+
+
+def _match(match_id, puuids):
+    return {
+        "metadata": {"matchId": match_id, "participants": puuids},
+        "info": {"participants": [{"puuid": p} for p in puuids]},
+    }
+
+
+class TestMatchIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.matches_dir = Path(self._tmp.name)
+        self._write("EUW1_1", ["me", "a"])
+        self._write("EUW1_2", ["me", "b"])
+        self._write("EUW1_3", ["a", "b"])
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, match_id, puuids):
+        (self.matches_dir / f"{match_id}.json").write_text(
+            json.dumps(_match(match_id, puuids)), encoding="utf-8"
+        )
+
+    def test_counts_and_reuses_index(self):
+        """Counts come from the index; unchanged files are not re-parsed"""
+        self.assertEqual(match_index.count_player_matches(self.matches_dir, "me"), 2)
+        self.assertTrue((self.matches_dir / match_index.INDEX_FILENAME).exists())
+
+        with patch("stats_visualization.match_index.load_match_json") as mock_loads:
+            self.assertEqual(match_index.count_player_matches(self.matches_dir, "a"), 2)
+        mock_loads.assert_not_called()
+
+    def test_index_tracks_added_changed_and_removed_files(self):
+        """New, rewritten and deleted files are reflected on the next count"""
+        match_index.count_player_matches(self.matches_dir, "me")
+        self._write("EUW1_4", ["me"])
+        self._write("EUW1_3", ["a", "b", "me", "c"])
+        (self.matches_dir / "EUW1_1.json").unlink()
+
+        self.assertEqual(match_index.count_player_matches(self.matches_dir, "me"), 3)
+        self.assertEqual(match_index.count_player_matches(self.matches_dir, "a"), 1)
+
+    def test_missing_dir_and_unavailable_index(self):
+        """Missing directories count 0; index errors fall back to a file scan"""
+        self.assertEqual(match_index.count_player_matches(self.matches_dir / "nope", "me"), 0)
+        with patch(
+            "stats_visualization.match_index.refresh_index",
+            side_effect=sqlite3.OperationalError("read-only"),
+        ):
+            self.assertEqual(match_index.count_player_matches(self.matches_dir, "me"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -58,6 +58,19 @@ class TestPersonalPerformance(unittest.TestCase):
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0], self.mock_match_data)
 
+    def test_extract_player_games(self) -> None:
+        sparse: Dict[str, Any] = {
+            "info": {"participants": [{"puuid": self.test_puuid, "kills": 1}]}
+        }
+        games = personal_performance.extract_player_games(
+            [self.mock_match_data, sparse, {"metadata": {}}], self.test_puuid
+        )
+        self.assertEqual(len(games), 2)
+        self.assertEqual(games[0].champion, "TestChamp")
+        self.assertEqual((games[0].kills, games[0].damage, games[0].win), (5, 25000, True))
+        # Missing fields fall back to the same defaults as dict.get
+        self.assertEqual((games[1].champion, games[1].kills, games[1].win), ("Unknown", 1, False))
+
     def test_plot_performance_trends(self) -> None:
         # Provide at least one match with correct puuid to trigger plotting
         with patch(